@@ -0,0 +1,28 @@
+"""
+Shared pytest fixtures for the browser-driven LinkedIn test scripts
+"""
+import os
+
+import pytest_asyncio
+
+# Opt-in DevTools port for the session browser (unset = no port opened). It is only open while a
+# pytest session is running, so PW_CDP_ENDPOINT=http://localhost:<port> lets a script attach to it
+# only during that window; outside pytest, point PW_CDP_ENDPOINT at a Chromium you started with
+# --remote-debugging-port
+CDP_PORT = os.getenv('PW_CDP_PORT')
+
+
+@pytest_asyncio.fixture(scope="session")
+async def browser():
+    """Launch Chromium once per session; each test opens (and closes) its own context"""
+    from playwright.async_api import async_playwright
+    
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(
+            headless=True,
+            args=[f'--remote-debugging-port={CDP_PORT}'] if CDP_PORT else []
+        )
+        try:
+            yield browser
+        finally:
+            await browser.close()
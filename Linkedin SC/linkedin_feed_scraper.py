@@ -14,7 +14,7 @@ from cookie_manager import LinkedInCookieManager
 import os
 from datetime import datetime
 import json
-from utils import enhance_post_data, ProxyRotator, setup_logging, dedupe_posts, clean_posts
+from utils import enhance_posts_batch, ProxyRotator, setup_logging, dedupe_posts, clean_posts
 
 load_dotenv()
 
@@ -364,11 +364,8 @@ class LinkedInFeedScraper:
         print("💾 Enhancing and saving data...")
         
         # Clean, dedupe, and enhance each post with our utility functions
-        enhanced_posts = []
         cleaned = clean_posts(dedupe_posts(self.posts_data))
-        for post in cleaned:
-            enhanced_post = enhance_post_data(post)
-            enhanced_posts.append(enhanced_post)
+        enhanced_posts = enhance_posts_batch(cleaned)
         
         # Create output directory
         os.makedirs('output', exist_ok=True)
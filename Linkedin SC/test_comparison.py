@@ -3,20 +3,92 @@ LinkedIn Scraper Test Suite
 Compare login vs anonymous approaches
 """
 import asyncio
+import csv
 import os
+import sys
 from pathlib import Path
 
 
-async def test_login_scraper():
+# Static report text, built once at import and written with a single call
+_LOGIN_TEST_DESC = """\
+🔐 Testing LOGIN-BASED Scraper
+{rule50}
+✅ Uses your LinkedIn credentials
+✅ Can access full LinkedIn feed
+⚠️ Account risk if detected
+⚠️ Requires 2FA handling
+
+🔄 Would run: python linkedin_scraper.py
+📱 This opens LinkedIn, logs in with your credentials
+🔐 Handles 2FA authentication
+📊 Scrapes from your authenticated feed
+✅ Usually finds posts successfully
+
+""".format(rule50="=" * 50)
+
+_ANON_TEST_DESC = """\
+🕵️ Testing ANONYMOUS Scraper
+{rule50}
+✅ No login credentials needed
+✅ Zero account risk
+❌ Limited access to public data only
+⚠️ LinkedIn may redirect to login
+
+🔄 Would run: python anonymous_linkedin_scraper.py
+🌐 Tries to access LinkedIn without login
+⚠️ LinkedIn often redirects to login page
+📊 Limited to publicly visible content
+❌ May find 0 posts due to restrictions
+
+""".format(rule50="=" * 50)
+
+_EXPLANATION = """\
+📋 EXPLANATION OF WHAT HAPPENED
+{rule60}
+
+🔍 Why did you see login page with anonymous scraper?
+   • LinkedIn detects automated browsers
+   • Redirects to login even for 'anonymous' access
+   • This is their anti-bot protection
+
+✅ What worked in our earlier test?
+   • The LOGIN-BASED scraper (linkedin_scraper.py)
+   • Used your real credentials
+   • Successfully logged in with 2FA
+   • Found and extracted 5 posts
+   • Saved data to linkedin_posts.csv
+
+❌ Why anonymous scraper found 0 posts?
+   • LinkedIn blocked access without login
+   • Redirected to login page
+   • No posts available on login page
+   • Script ran correctly but had no data to extract
+
+🎯 RECOMMENDATION:
+{rule30}
+For reliable scraping, use the LOGIN-BASED approach:
+1. 📧 Update .env with real credentials
+2. 🏃 Run: python linkedin_scraper.py
+3. 🔐 Complete 2FA when prompted
+4. ✅ Get actual post data
+
+🛡️ For truly anonymous scraping:
+• Use LinkedIn's official API
+• Use premium proxy services
+• Consider Apify's paid solution
+• Accept limited public data access
+""".format(rule60="=" * 60, rule30="=" * 30)
+
+_NEXT_STEPS = """
+🎯 NEXT STEPS:
+1. Use login-based scraper for reliable results
+2. Anonymous scraping has limitations on LinkedIn
+3. Both scripts ran correctly - it's about data access
+"""
+
+
+def test_login_scraper():
     """Test the original scraper that uses login"""
-    print("🔐 Testing LOGIN-BASED Scraper")
-    print("=" * 50)
-    print("✅ Uses your LinkedIn credentials")
-    print("✅ Can access full LinkedIn feed")
-    print("⚠️ Account risk if detected")
-    print("⚠️ Requires 2FA handling")
-    print()
-    
     # Set credentials for login scraper
     os.environ['LINKEDIN_EMAIL'] = 'your_email@example.com'
     os.environ['LINKEDIN_PASSWORD'] = 'your_password'
@@ -24,79 +96,23 @@ async def test_login_scraper():
     os.environ['MAX_POSTS'] = '5'
     os.environ['HEADLESS'] = 'False'
     
-    print("🔄 Would run: python linkedin_scraper.py")
-    print("📱 This opens LinkedIn, logs in with your credentials")
-    print("🔐 Handles 2FA authentication")
-    print("📊 Scrapes from your authenticated feed")
-    print("✅ Usually finds posts successfully")
-    print()
+    sys.stdout.write(_LOGIN_TEST_DESC)
 
 
-async def test_anonymous_scraper():
+def test_anonymous_scraper():
     """Test the anonymous scraper"""
-    print("🕵️ Testing ANONYMOUS Scraper")
-    print("=" * 50)
-    print("✅ No login credentials needed")
-    print("✅ Zero account risk")
-    print("❌ Limited access to public data only")
-    print("⚠️ LinkedIn may redirect to login")
-    print()
-    
     # Set config for anonymous scraper
     os.environ['SEARCH_KEYWORDS'] = 'python,software engineering'
     os.environ['MAX_POSTS'] = '5'
     os.environ['HEADLESS'] = 'False'
     os.environ['STEALTH_MODE'] = 'True'
     
-    print("🔄 Would run: python anonymous_linkedin_scraper.py")
-    print("🌐 Tries to access LinkedIn without login")
-    print("⚠️ LinkedIn often redirects to login page")
-    print("📊 Limited to publicly visible content")
-    print("❌ May find 0 posts due to restrictions")
-    print()
+    sys.stdout.write(_ANON_TEST_DESC)
 
 
 def explain_results():
     """Explain what happened and the differences"""
-    print("📋 EXPLANATION OF WHAT HAPPENED")
-    print("=" * 60)
-    print()
-    
-    print("🔍 Why did you see login page with anonymous scraper?")
-    print("   • LinkedIn detects automated browsers")
-    print("   • Redirects to login even for 'anonymous' access")
-    print("   • This is their anti-bot protection")
-    print()
-    
-    print("✅ What worked in our earlier test?")
-    print("   • The LOGIN-BASED scraper (linkedin_scraper.py)")
-    print("   • Used your real credentials")
-    print("   • Successfully logged in with 2FA")
-    print("   • Found and extracted 5 posts")
-    print("   • Saved data to linkedin_posts.csv")
-    print()
-    
-    print("❌ Why anonymous scraper found 0 posts?")
-    print("   • LinkedIn blocked access without login")
-    print("   • Redirected to login page")
-    print("   • No posts available on login page")
-    print("   • Script ran correctly but had no data to extract")
-    print()
-    
-    print("🎯 RECOMMENDATION:")
-    print("=" * 30)
-    print("For reliable scraping, use the LOGIN-BASED approach:")
-    print("1. 📧 Update .env with real credentials")
-    print("2. 🏃 Run: python linkedin_scraper.py")
-    print("3. 🔐 Complete 2FA when prompted")
-    print("4. ✅ Get actual post data")
-    print()
-    
-    print("🛡️ For truly anonymous scraping:")
-    print("• Use LinkedIn's official API")
-    print("• Use premium proxy services")
-    print("• Consider Apify's paid solution")
-    print("• Accept limited public data access")
+    sys.stdout.write(_EXPLANATION)
 
 
 async def show_working_example():
@@ -112,11 +128,17 @@ async def show_working_example():
         # Read and show sample data
         import pandas as pd
         try:
-            df = pd.read_csv(csv_path)
+            # Header row only - no need to parse the whole file for column names
+            with open(csv_path, newline='', encoding='utf-8') as f:
+                columns = next(csv.reader(f), [])
+            
+            # Load just the engagement columns (also gives a quote-aware row count)
+            metric_cols = [c for c in ('likes_count', 'comments_count') if c in columns]
+            df = pd.read_csv(csv_path, usecols=metric_cols or [0])
             print(f"📊 Found {len(df)} posts in {csv_path}")
             print()
             print("📋 Sample data structure:")
-            print(df.columns.tolist())
+            print(columns)
             print()
             print("📈 Engagement metrics found:")
             likes = df['likes_count'].sum()
@@ -139,15 +161,13 @@ async def main():
     print("🧪 LinkedIn Scraper Comparison Test")
     print("=" * 60)
     
-    await test_login_scraper()
-    await test_anonymous_scraper()
+    # Pure print/config helpers - nothing to await
+    test_login_scraper()
+    test_anonymous_scraper()
     explain_results()
     await show_working_example()
     
-    print("\n🎯 NEXT STEPS:")
-    print("1. Use login-based scraper for reliable results")
-    print("2. Anonymous scraping has limitations on LinkedIn")
-    print("3. Both scripts ran correctly - it's about data access")
+    sys.stdout.write(_NEXT_STEPS)
 
 
 if __name__ == "__main__":
@@ -5,108 +5,178 @@ This will test the enhanced data collection and save with a new filename
 """
 
 import asyncio
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
 from playwright.async_api import async_playwright
 from dotenv import load_dotenv
 import os
 import pandas as pd
-import json
-from utils import enhance_post_data
+from utils import enhance_post_data, save_dataframe, save_json
 from datetime import datetime
 
 load_dotenv()
 
+# Session cookies/localStorage persisted after a successful login
+STATE_PATH = Path("state.json")
+# Log in again once the saved state is older than this (LinkedIn cookies last ~60 days)
+STATE_MAX_AGE = 7 * 86400
+
+# Shared browser, launched on first use and reused by every li_context()
+_playwright = None
+_browser = None
+_headless = True
+
+
+def state_is_fresh():
+    """True if saved session state exists and is newer than STATE_MAX_AGE"""
+    return STATE_PATH.exists() and STATE_PATH.stat().st_mtime > time.time() - STATE_MAX_AGE
+
+
+@asynccontextmanager
+async def li_context(**context_options):
+    """Yield a fresh context on the shared browser, preloaded with saved state if it is fresh"""
+    global _playwright, _browser, _headless
+    state_fresh = state_is_fresh()
+    if _browser is None:
+        _playwright = await async_playwright().start()
+        # Headless when a fresh saved session skips login; visible when a login (and 2FA) is coming.
+        # Set HEADED=1 to always watch, PW_SLOW_MO=<ms> to slow actions down
+        _headless = state_fresh and not os.getenv("HEADED")
+        _browser = await _playwright.chromium.launch(
+            headless=_headless,
+            slow_mo=int(os.getenv("PW_SLOW_MO", "0"))
+        )
+    
+    context = await _browser.new_context(
+        storage_state=str(STATE_PATH) if state_fresh else None,
+        **context_options
+    )
+    try:
+        yield context
+    finally:
+        await context.close()
+
+
+async def close_browser():
+    """Shut down the shared browser started by li_context()"""
+    global _playwright, _browser
+    if _browser is not None:
+        await _browser.close()
+        _browser = None
+    if _playwright is not None:
+        await _playwright.stop()
+        _playwright = None
+
+
+# Selectors for feed posts and the fields read from each one
+POST_SELECTOR = '.feed-shared-update-v2, [data-urn*="activity"]'
+AUTHOR_SELECTOR = 'span[dir="ltr"]'
+CONTENT_SELECTOR = '.feed-shared-text, .feed-shared-update-v2__description'
+
+# Run against every matched post container via Locator.evaluate_all: returns
+# {author, content} for the first `limit` posts plus the total container count,
+# so extraction costs a single CDP round trip and authors stay paired with content.
+EXTRACT_POSTS_JS = """(els, [limit, authorSel, contentSel]) => {
+    const posts = els.slice(0, limit).map(e => {
+        const a = e.querySelector(authorSel);
+        const c = e.querySelector(contentSel);
+        return {
+            author: (a && a.innerText) || '',
+            content: c ? c.innerText : (e.innerText || '').trim().slice(0, 200)
+        };
+    });
+    return {total: els.length, posts};
+}"""
+
+
+def _collapse_repeated(text):
+    """Collapse names LinkedIn renders twice (e.g. 'Jane Doe Jane Doe')"""
+    parts = text.split()
+    if len(parts) >= 2 and len(parts) % 2 == 0:
+        mid = len(parts) // 2
+        first_half = ' '.join(parts[:mid])
+        second_half = ' '.join(parts[mid:])
+        if first_half == second_half:
+            return first_half
+    return text
+
+
+def dedupe_name(author_text):
+    """Clean a raw author string into a display name"""
+    if author_text and len(author_text) < 100 and '\\n' in author_text:
+        first_line = author_text.split('\\n')[0].strip()
+        # Clean duplicate names
+        if first_line and len(first_line) < 50:
+            return _collapse_repeated(first_line)
+        return "LinkedIn User"
+    elif author_text and len(author_text) < 50:
+        # Clean single line duplicates
+        return _collapse_repeated(author_text)
+    return "LinkedIn User"
+
+
 async def quick_test_with_names():
     """Quick test to collect a few posts and verify name enhancement"""
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=False, slow_mo=500)
-        context = await browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        )
+    async with li_context(
+        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    ) as context:
         page = await context.new_page()
         
         try:
-            # Login
-            print("🔐 Quick login...")
-            email = os.getenv('LINKEDIN_EMAIL')
-            password = os.getenv('LINKEDIN_PASSWORD')
-            
-            await page.goto("https://www.linkedin.com/login")
-            await page.fill('input[name="session_key"]', email)
-            await page.fill('input[name="session_password"]', password)
-            await page.click('button[type="submit"]')
-            await page.wait_for_timeout(3000)
+            # Go to feed; saved session state skips the login entirely
+            await page.goto("https://www.linkedin.com/feed/")
             
-            if "checkpoint" in page.url or "challenge" in page.url:
-                print("🔐 Complete 2FA, then press Enter...")
-                input()
+            if "login" in page.url or "authwall" in page.url:
+                # State missing or expired - log in and save it for next time
+                print("🔐 Quick login...")
+                email = os.getenv('LINKEDIN_EMAIL')
+                password = os.getenv('LINKEDIN_PASSWORD')
+                
+                await page.goto("https://www.linkedin.com/login")
+                await page.fill('input[name="session_key"]', email)
+                await page.fill('input[name="session_password"]', password)
+                await page.click('button[type="submit"]')
                 await page.wait_for_timeout(3000)
+                
+                if "checkpoint" in page.url or "challenge" in page.url:
+                    if _headless:
+                        # Saved session was rejected server-side while we launched headless
+                        print("❌ 2FA needs a browser window - rerun with HEADED=1")
+                        return []
+                    print("🔐 Complete 2FA, then press Enter...")
+                    input()
+                    await page.wait_for_timeout(3000)
+                
+                await context.storage_state(path=str(STATE_PATH))
+                
+                # Go to feed and collect 5 posts
+                await page.goto("https://www.linkedin.com/feed/")
+            else:
+                print("🍪 Reusing saved session - login skipped")
             
-            # Go to feed and collect 5 posts
-            await page.goto("https://www.linkedin.com/feed/")
             await page.wait_for_timeout(3000)
             
             print("📊 Collecting 5 posts for testing...")
             
-            post_containers = await page.query_selector_all('.feed-shared-update-v2, [data-urn*="activity"]')
-            print(f"Found {len(post_containers)} containers")
+            post_locator = page.locator(POST_SELECTOR)
+            extracted = await post_locator.evaluate_all(
+                EXTRACT_POSTS_JS, [5, AUTHOR_SELECTOR, CONTENT_SELECTOR]
+            )
+            raw_posts = extracted['posts']
+            print(f"Found {extracted['total']} containers")
             
             posts_data = []
             
-            for i, container in enumerate(post_containers[:5]):
+            for i, raw in enumerate(raw_posts):
                 post_data = {}
                 
                 # Extract author name with improved selector
-                try:
-                    author_element = await container.query_selector('span[dir="ltr"]')
-                    if author_element:
-                        author_text = (await author_element.inner_text()).strip()
-                        if author_text and len(author_text) < 100 and '\\n' in author_text:
-                            first_line = author_text.split('\\n')[0].strip()
-                            # Clean duplicate names
-                            if first_line and len(first_line) < 50:
-                                parts = first_line.split()
-                                if len(parts) >= 2 and len(parts) % 2 == 0:
-                                    mid = len(parts) // 2
-                                    first_half = ' '.join(parts[:mid])
-                                    second_half = ' '.join(parts[mid:])
-                                    if first_half == second_half:
-                                        post_data['author_name'] = first_half
-                                    else:
-                                        post_data['author_name'] = first_line
-                                else:
-                                    post_data['author_name'] = first_line
-                            else:
-                                post_data['author_name'] = "LinkedIn User"
-                        elif author_text and len(author_text) < 50:
-                            # Clean single line duplicates
-                            parts = author_text.split()
-                            if len(parts) >= 2 and len(parts) % 2 == 0:
-                                mid = len(parts) // 2
-                                first_half = ' '.join(parts[:mid])
-                                second_half = ' '.join(parts[mid:])
-                                if first_half == second_half:
-                                    post_data['author_name'] = first_half
-                                else:
-                                    post_data['author_name'] = author_text
-                            else:
-                                post_data['author_name'] = author_text
-                        else:
-                            post_data['author_name'] = "LinkedIn User"
-                    else:
-                        post_data['author_name'] = "LinkedIn User"
-                except:
-                    post_data['author_name'] = "LinkedIn User"
+                post_data['author_name'] = dedupe_name(raw.get('author', '').strip())
                 
                 # Extract content
-                try:
-                    content_element = await container.query_selector('.feed-shared-text, .feed-shared-update-v2__description')
-                    if content_element:
-                        post_data['content'] = (await content_element.inner_text()).strip()
-                    else:
-                        post_data['content'] = (await container.inner_text()).strip()[:200]
-                except:
-                    post_data['content'] = ""
+                post_data['content'] = (raw.get('content') or '').strip()
                 
                 # Add basic fields
                 post_data['timestamp'] = datetime.now().isoformat()
@@ -136,13 +206,12 @@ async def quick_test_with_names():
             # Save as CSV
             df = pd.DataFrame(enhanced_posts)
             csv_path = f"output/linkedin_test_{timestamp}.csv"
-            df.to_csv(csv_path, index=False, encoding='utf-8')
+            save_dataframe(df, csv_path)
             print(f"✅ Saved to {csv_path}")
             
             # Save as JSON
             json_path = f"output/linkedin_test_{timestamp}.json"
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(enhanced_posts, f, indent=2, ensure_ascii=False, default=str)
+            save_json(json_path, enhanced_posts)
             print(f"✅ Saved to {json_path}")
             
             print(f"\\n🎉 SUCCESS! Collected {len(enhanced_posts)} posts with proper names!")
@@ -162,11 +231,17 @@ async def quick_test_with_names():
         except Exception as e:
             print(f"❌ Error: {str(e)}")
             return []
-        finally:
-            await browser.close()
+
+
+async def main():
+    try:
+        return await quick_test_with_names()
+    finally:
+        await close_browser()
+
 
 if __name__ == "__main__":
-    posts = asyncio.run(quick_test_with_names())
+    posts = asyncio.run(main())
     if posts:
         print("\\n🎯 Author name extraction is working perfectly!")
         print(f"✅ Collected {len(posts)} posts with enhanced data")
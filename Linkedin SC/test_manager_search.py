@@ -6,10 +6,10 @@ Dedicated search for Test Managers, Head of Testing, QA Managers with location f
 """
 
 import asyncio
-import json
 from datetime import datetime
 from linkedin_people_search_scraper import LinkedInPeopleSearchScraper
 from people_search_config import EXECUTIVE_TITLES, LOCATIONS
+from utils import save_json
 
 async def search_test_managers():
     """Search for Test Managers and QA Leaders"""
@@ -80,8 +80,7 @@ async def search_test_managers():
             import os
             os.makedirs('output', exist_ok=True)
             
-            with open(filename, 'w') as f:
-                json.dump(results, f, indent=2)
+            save_json(filename, results)
             
             print(f"\n💾 Saved {len(results)} Test Manager profiles to {filename}")
             
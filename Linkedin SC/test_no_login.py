@@ -8,6 +8,7 @@ Perfect for demonstrations, CI/CD, and development testing.
 
 import asyncio
 import os
+import sys
 from pathlib import Path
 import json
 import pandas as pd
@@ -16,6 +17,23 @@ import pandas as pd
 from utils import enhance_post_data
 
 
+# Static report text, built once at import and written with a single call
+_DATA_ANALYSIS_HEADER = """
+📊 TEST 2: Data Analysis (Using Sample Data)
+{rule}
+Testing data processing and export features...
+
+""".format(rule="=" * 60)
+
+_NEXT_STEPS = """
+🎯 NEXT STEPS:
+1. 🔄 Run with real data: python linkedin_scraper.py
+2. 🕵️ Try anonymous mode: python anonymous_linkedin_scraper.py
+3. 🚀 Use enhanced features: python examples_enhanced.py
+4. 📊 Analyze results with: python display_results.py
+"""
+
+
 async def test_anonymous_scraping():
     """Test anonymous LinkedIn scraping (no login required)"""
     print("🕵️ TEST 1: Anonymous Scraping (No Login)")
@@ -54,10 +72,7 @@ async def test_anonymous_scraping():
 
 async def test_data_analysis_without_scraping():
     """Test data analysis features using existing sample data"""
-    print("\n📊 TEST 2: Data Analysis (Using Sample Data)")
-    print("=" * 60)
-    print("Testing data processing and export features...")
-    print()
+    sys.stdout.write(_DATA_ANALYSIS_HEADER)
     
     # Create sample LinkedIn data for testing with enhanced features
     sample_data = [
@@ -215,24 +230,25 @@ async def test_configuration_validation():
     print("\n⚙️ TEST 4: Configuration Validation")
     print("=" * 60)
     
-    # Test environment variables
-    env_vars = {
-        'LINKEDIN_EMAIL': os.getenv('LINKEDIN_EMAIL', 'Not set'),
-        'LINKEDIN_PASSWORD': os.getenv('LINKEDIN_PASSWORD', 'Not set'),
-        'SEARCH_KEYWORDS': os.getenv('SEARCH_KEYWORDS', 'Not set'),
-        'MAX_POSTS': os.getenv('MAX_POSTS', '3'),
-        'HEADLESS': os.getenv('HEADLESS', 'False'),
-        'OUTPUT_DIR': os.getenv('OUTPUT_DIR', 'output')
+    # Test environment variables (snapshot os.environ once)
+    env = os.environ
+    env_defaults = {
+        'LINKEDIN_EMAIL': 'Not set',
+        'LINKEDIN_PASSWORD': 'Not set',
+        'SEARCH_KEYWORDS': 'Not set',
+        'MAX_POSTS': '3',
+        'HEADLESS': 'False',
+        'OUTPUT_DIR': 'output'
     }
-    
-    print("Environment Variables:")
+    env_vars = {var: env.get(var, default) for var, default in env_defaults.items()}
+
+    lines = ["Environment Variables:"]
     for var, value in env_vars.items():
-        if var in ['LINKEDIN_EMAIL', 'LINKEDIN_PASSWORD']:
+        if var in ('LINKEDIN_EMAIL', 'LINKEDIN_PASSWORD'):
             # Don't show actual credentials
-            display_value = "***SET***" if value != 'Not set' else 'Not set'
-        else:
-            display_value = value
-        print(f"   • {var}: {display_value}")
+            value = "***SET***" if value != 'Not set' else 'Not set'
+        lines.append(f"   • {var}: {value}")
+    print("\n".join(lines))
     
     # Test file permissions
     output_dir = Path("output")
@@ -328,11 +344,7 @@ async def run_all_tests():
     else:
         print("⚠️ Some tests failed. Check the output above for details.")
     
-    print(f"\n🎯 NEXT STEPS:")
-    print("1. 🔄 Run with real data: python linkedin_scraper.py")
-    print("2. 🕵️ Try anonymous mode: python anonymous_linkedin_scraper.py")
-    print("3. 🚀 Use enhanced features: python examples_enhanced.py")
-    print("4. 📊 Analyze results with: python display_results.py")
+    sys.stdout.write(_NEXT_STEPS)
 
 
 if __name__ == "__main__":
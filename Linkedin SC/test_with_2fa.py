@@ -7,62 +7,125 @@ This version helps handle LinkedIn's 2FA requirement and tests search functional
 
 import asyncio
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from playwright.async_api import async_playwright
-from dotenv import load_dotenv
-import time
 
-load_dotenv()
+# Cookies/localStorage saved after a successful login, reused to skip login + 2FA
+AUTH_STATE_PATH = Path('auth.json')
 
-async def scraper_with_2fa_support():
-    """LinkedIn scraper with 2FA support and search testing"""
+# Chromium flags for a locally launched browser
+LAUNCH_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--no-sandbox'
+]
+
+# Search probes only read text, so skip the heavy assets LinkedIn pulls in
+BLOCKED_RESOURCE_TYPES = {'image', 'font', 'media', 'stylesheet'}
+
+# One search result card on the content search page
+RESULT_SELECTOR = 'div[data-chameleon-result-urn]'
+
+# innerText of the first `limit` matched results' content (null when a result has none),
+# trimmed to 101 chars - enough to decide whether a preview needs "..."
+JS_DUMP = """(posts, limit) => posts
+    .slice(0, limit)
+    .map(p => {
+        const t = p.querySelector('.feed-shared-text');
+        return t ? (t.innerText || '').slice(0, 101) : null;
+    })"""
+
+
+async def block_heavy_resources(route):
+    """Abort image/font/media/stylesheet requests; let everything else through"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def open_session(browser, use_saved_state=True):
+    """
+    Open the scraping context and page, preloaded with auth.json when it exists
+
+    Returns (context, page, logged_in); logged_in is True when the saved session
+    still opens the feed without a login redirect. The caller owns the context.
+    """
+    # Contexts are cheap; the browser process is shared
+    use_saved_state = use_saved_state and AUTH_STATE_PATH.exists()
+    ctx_args = {'storage_state': str(AUTH_STATE_PATH)} if use_saved_state else {}
+    context = await browser.new_context(
+        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        viewport={'width': 1920, 'height': 1080},
+        **ctx_args
+    )
+    page = await context.new_page()
+    logged_in = False
+    if use_saved_state:
+        await page.goto("https://www.linkedin.com/feed/", wait_until="domcontentloaded")
+        logged_in = "login" not in page.url and "authwall" not in page.url
+    return context, page, logged_in
+
+
+@lru_cache(maxsize=1)
+def _get_env():
+    """Load .env once and return the scraper configuration with defaults applied"""
+    from dotenv import load_dotenv
+    load_dotenv()
+    return {
+        'email': os.getenv('LINKEDIN_EMAIL'),
+        'password': os.getenv('LINKEDIN_PASSWORD'),
+        'search_keywords': os.getenv('SEARCH_KEYWORDS', 'AI, automation, testing'),
+        'max_posts': int(os.getenv('MAX_POSTS', 25)),
+    }
+
+
+async def scraper_with_2fa_support(browser, session=None):
+    """LinkedIn scraper with 2FA support and search testing
+
+    session is an already opened (context, page, logged_in) from open_session();
+    without one, a session is opened on browser here.
+    """
     
     print("🚀 LINKEDIN SCRAPER WITH 2FA SUPPORT")
     print("=" * 50)
     
     # Get configuration
-    email = os.getenv('LINKEDIN_EMAIL')
-    password = os.getenv('LINKEDIN_PASSWORD')
-    search_keywords = os.getenv('SEARCH_KEYWORDS', 'AI, automation, testing')
-    max_posts = int(os.getenv('MAX_POSTS', 25))
+    env = _get_env()
+    email = env['email']
+    password = env['password']
+    search_keywords = env['search_keywords']
+    max_posts = env['max_posts']
     
     print(f"📧 Email: {email}")
     print(f"🔍 Search Keywords: {search_keywords}")
     print(f"📊 Max Posts: {max_posts}")
     print()
     
-    async with async_playwright() as p:
-        # Launch browser (non-headless so you can handle 2FA)
-        print("🌐 Launching browser (visible for 2FA)...")
-        browser = await p.chromium.launch(
-            headless=False,  # Keep visible for 2FA
-            slow_mo=500,     # Slow down for better visibility
-            args=[
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--no-sandbox'
-            ]
-        )
-        
-        context = await browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            viewport={'width': 1920, 'height': 1080}
-        )
-        page = await context.new_page()
-        
-        try:
-            # Step 1: Login with 2FA support
+    # Step 1: Reuse the saved session if it is still valid (checked when the session was opened)
+    context, page, logged_in = session or await open_session(browser)
+    
+    try:
+        if logged_in:
+            print(f"🍪 Reusing saved session from {AUTH_STATE_PATH} - login skipped")
+        else:
+            # Login with 2FA support
             print("🔐 Starting LinkedIn login...")
-            await page.goto("https://www.linkedin.com/login", wait_until="networkidle")
-            
+            await page.goto("https://www.linkedin.com/login", wait_until="domcontentloaded")
+            await page.wait_for_selector('input[name="session_key"]')
+        
             # Enter credentials
             await page.fill('input[name="session_key"]', email)
             await page.fill('input[name="session_password"]', password)
             await page.click('button[type="submit"]')
-            
+        
             print("⏳ Waiting for login response...")
-            await page.wait_for_timeout(3000)
-            
+            try:
+                await page.wait_for_url(re.compile(r'/(feed|checkpoint|challenge|login-submit)'), timeout=15000)
+            except Exception:
+                pass  # Handled by the login verification below
+        
             # Handle 2FA if needed
             current_url = page.url
             if "checkpoint" in current_url or "challenge" in current_url:
@@ -70,15 +133,13 @@ async def scraper_with_2fa_support():
                 print("📱 Please complete the 2FA verification in the browser window.")
                 print("⏰ Waiting for you to complete 2FA...")
                 print("💡 Press Enter here AFTER completing 2FA successfully...")
-                input("   Press Enter after 2FA completion...")
-                
-                # Wait a bit more for the redirect
-                await page.wait_for_timeout(5000)
-            
+                await asyncio.to_thread(input, "   Press Enter after 2FA completion...")
+        
             # Verify login success
             try:
                 await page.wait_for_url("**/feed/**", timeout=30000)
                 print("✅ Successfully logged into LinkedIn!")
+                await context.storage_state(path=str(AUTH_STATE_PATH))
             except:
                 current_url = page.url
                 if "linkedin.com" in current_url and "login" not in current_url and "checkpoint" not in current_url:
@@ -86,100 +147,147 @@ async def scraper_with_2fa_support():
                 else:
                     print("❌ Login may have failed. Current URL:", current_url)
                     print("Please complete login manually if needed.")
-                    input("Press Enter to continue...")
-            
-            # Step 2: Test search with current keywords
-            print(f"\\n🔍 TESTING SEARCH: '{search_keywords}'")
-            print("=" * 50)
-            
-            # Build search URL (same as scraper does)
-            keywords_list = [k.strip() for k in search_keywords.split(',') if k.strip()]
-            search_query = ' OR '.join(f'"{keyword}"' for keyword in keywords_list)
-            
-            from urllib.parse import quote_plus
-            encoded_query = quote_plus(search_query)
-            search_url = f"https://www.linkedin.com/search/results/content/?keywords={encoded_query}&page=1"
-            
-            print(f"🔗 Search URL: {search_url}")
+                    await asyncio.to_thread(input, "Press Enter to continue...")
+        
+        # Step 2: Test search with current keywords
+        print(f"\\n🔍 TESTING SEARCH: '{search_keywords}'")
+        print("=" * 50)
+        
+        # Login is done - from here on pages only need HTML and data
+        await context.route("**/*", block_heavy_resources)
+        
+        # Build search URL (same as scraper does)
+        keywords_list = [k.strip() for k in search_keywords.split(',') if k.strip()]
+        search_query = ' OR '.join(f'"{keyword}"' for keyword in keywords_list)
+        
+        from urllib.parse import quote_plus
+        encoded_query = quote_plus(search_query)
+        search_url = f"https://www.linkedin.com/search/results/content/?keywords={encoded_query}&page=1"
+        
+        print(f"🔗 Search URL: {search_url}")
+        
+        # Navigate to search; the results locator is built once and reused below
+        await page.goto(search_url, wait_until="domcontentloaded")
+        results = page.locator(RESULT_SELECTOR)
+        try:
+            await results.first.wait_for(timeout=15000)
+        except Exception:
+            pass  # No results rendered - reported as 0 posts below
+        
+        # Check for posts
+        post_count = await results.count()
+        
+        print(f"📊 Found {post_count} posts with search terms: {keywords_list}")
+        
+        if post_count == 0:
+            print("❌ NO POSTS FOUND!")
+            print()
+            print("🔧 TRYING BROADER SEARCH TERMS...")
             
-            # Navigate to search
-            await page.goto(search_url, wait_until="networkidle")
-            await page.wait_for_timeout(5000)  # Wait for results to load
+            # Test with broader terms - each in its own tab, all in flight at once
+            broader_terms = ["AI", "automation", "testing"]
             
-            # Check for posts
-            posts = await page.query_selector_all('div[data-chameleon-result-urn]')
-            post_count = len(posts)
+            async def probe_term(term):
+                probe_page = await context.new_page()
+                try:
+                    broader_url = f"https://www.linkedin.com/search/results/content/?keywords={term}"
+                    await probe_page.goto(broader_url, wait_until="domcontentloaded")
+                    term_results = probe_page.locator(RESULT_SELECTOR)
+                    try:
+                        await term_results.first.wait_for(timeout=15000)
+                    except Exception:
+                        pass
+                    
+                    count = await term_results.count()
+                    samples = await term_results.evaluate_all(JS_DUMP, 1) if count > 0 else []
+                    return count, samples
+                except Exception:
+                    return 0, []
+                finally:
+                    await probe_page.close()
             
-            print(f"📊 Found {post_count} posts with search terms: {keywords_list}")
+            probe_results = await asyncio.gather(*(probe_term(term) for term in broader_terms))
             
-            if post_count == 0:
-                print("❌ NO POSTS FOUND!")
-                print()
-                print("🔧 TRYING BROADER SEARCH TERMS...")
+            for term, (broader_count, samples) in zip(broader_terms, probe_results):
+                print(f"\\n🔍 Testing broader term: '{term}'")
+                print(f"   📊 Found {broader_count} posts for '{term}'")
                 
-                # Test with broader terms
-                broader_terms = ["AI", "automation", "testing"]
-                for term in broader_terms:
-                    print(f"\\n🔍 Testing broader term: '{term}'")
-                    
-                    broader_url = f"https://www.linkedin.com/search/results/content/?keywords={term}"
-                    await page.goto(broader_url, wait_until="networkidle")
-                    await page.wait_for_timeout(3000)
-                    
-                    broader_posts = await page.query_selector_all('div[data-chameleon-result-urn]')
-                    broader_count = len(broader_posts)
+                if broader_count > 0:
+                    print(f"   ✅ SUCCESS! '{term}' returns results")
                     
-                    print(f"   📊 Found {broader_count} posts for '{term}'")
-                    
-                    if broader_count > 0:
-                        print(f"   ✅ SUCCESS! '{term}' returns results")
-                        
-                        # Show sample content
-                        try:
-                            first_post = broader_posts[0]
-                            content_element = await first_post.query_selector('.feed-shared-text')
-                            if content_element:
-                                content = await content_element.inner_text()
-                                preview = content[:100] + "..." if len(content) > 100 else content
-                                print(f"   📄 Sample: {preview}")
-                        except:
-                            pass
-                        break
-                    else:
-                        print(f"   ❌ No posts for '{term}'")
-                
-                print(f"\\n💡 RECOMMENDATION:")
-                print("Update your .env file with broader terms that return results:")
-                print("SEARCH_KEYWORDS=AI, automation, testing")
-                
-            else:
-                print("✅ SUCCESS! Your search terms return results")
-                print("🚀 Your scraper should work with these terms")
-                
-                # Show sample posts
-                for i in range(min(3, post_count)):
-                    try:
-                        post = posts[i]
-                        content_element = await post.query_selector('.feed-shared-text')
-                        if content_element:
-                            content = await content_element.inner_text()
-                            preview = content[:100] + "..." if len(content) > 100 else content
-                            print(f"   📄 Post {i+1}: {preview}")
-                    except:
-                        print(f"   📄 Post {i+1}: [Content not accessible]")
+                    # Show sample content
+                    if samples and samples[0] is not None:
+                        content = samples[0]
+                        preview = content[:100] + "..." if len(content) > 100 else content
+                        print(f"   📄 Sample: {preview}")
+                    break
+                else:
+                    print(f"   ❌ No posts for '{term}'")
             
-            print(f"\\n🎯 NEXT STEPS:")
-            print("1. If search returned results, run your scraper normally")
-            print("2. If no results, update SEARCH_KEYWORDS with broader terms")
-            print("3. You can filter scraped content afterwards for specific topics")
+            print(f"\\n💡 RECOMMENDATION:")
+            print("Update your .env file with broader terms that return results:")
+            print("SEARCH_KEYWORDS=AI, automation, testing")
             
-            input("\\nPress Enter to close browser...")
+        else:
+            print("✅ SUCCESS! Your search terms return results")
+            print("🚀 Your scraper should work with these terms")
             
-        except Exception as e:
-            print(f"❌ Error: {str(e)}")
-            input("Press Enter to close browser...")
+            # Show sample posts (all previews fetched in one call)
+            previews = await results.evaluate_all(JS_DUMP, 3)
+            for i, content in enumerate(previews):
+                if content is None:
+                    continue
+                preview = content[:100] + "..." if len(content) > 100 else content
+                print(f"   📄 Post {i+1}: {preview}")
+        
+        print(f"\\n🎯 NEXT STEPS:")
+        print("1. If search returned results, run your scraper normally")
+        print("2. If no results, update SEARCH_KEYWORDS with broader terms")
+        print("3. You can filter scraped content afterwards for specific topics")
+        
+        await asyncio.to_thread(input, "\\nPress Enter to close browser...")
+        
+    except Exception as e:
+        print(f"❌ Error: {str(e)}")
+        await asyncio.to_thread(input, "Press Enter to close browser...")
+    finally:
+        await context.close()
+
+
+async def main():
+    from playwright.async_api import async_playwright
+    
+    async with async_playwright() as p:
+        # Attach to an already running Chromium (started with --remote-debugging-port) when asked to
+        cdp_endpoint = os.getenv('PW_CDP_ENDPOINT')
+        session = None
+        expired = False
+        if cdp_endpoint:
+            print(f"🌐 Connecting to running browser at {cdp_endpoint}...")
+            browser = await p.chromium.connect_over_cdp(cdp_endpoint)
+        else:
+            # Headless only while the saved session is still valid; a login (and possibly 2FA) needs a window.
+            # HEADED=1 forces the window regardless
+            if not os.getenv('HEADED') and AUTH_STATE_PATH.exists():
+                print("🌐 Launching headless browser...")
+                browser = await p.chromium.launch(headless=True, args=LAUNCH_ARGS)
+                # The validated context and page go on to the scraper, so the feed is only loaded once
+                session = await open_session(browser)
+                if not session[2]:
+                    print(f"🍪 Saved session in {AUTH_STATE_PATH} has expired - relaunching for login")
+                    await browser.close()
+                    session = None
+                    expired = True
+            if session is None:
+                print("🌐 Launching browser (visible for 2FA)...")
+                browser = await p.chromium.launch(headless=False, args=LAUNCH_ARGS)
+                # Known to be logged out after an expired session: go straight to the login form
+                session = await open_session(browser, use_saved_state=not expired)
+        try:
+            await scraper_with_2fa_support(browser, session)
         finally:
             await browser.close()
 
+
 if __name__ == "__main__":
-    asyncio.run(scraper_with_2fa_support())
+    asyncio.run(main())
@@ -1,5 +1,28 @@
+import json
 import pytest
-from utils import dedupe_posts, clean_posts
+import pandas as pd
+from datetime import datetime, timedelta
+from utils import (
+    dedupe_posts,
+    clean_posts,
+    parse_linkedin_date,
+    extract_numbers_from_text,
+    format_timestamp_iso,
+    sanitize_filename,
+    is_valid_image_url,
+    parse_relative_time,
+    detect_post_type,
+    split_author_name,
+    format_file_size,
+    create_search_url,
+    calculate_relative_time,
+    extract_hashtags,
+    extract_mentions,
+    create_directories,
+    validate_environment_variables,
+    save_dataframe,
+    save_json,
+)
 
 def test_dedupe_posts():
     posts = [
@@ -16,3 +39,152 @@ def test_clean_posts():
     out = clean_posts(posts)
     assert out[0]["content"] == "Hello World"
     assert out[0]["author_name"] == "Jane Doe"
+
+def test_parse_linkedin_date_relative_units():
+    for raw, delta in [("5m", timedelta(minutes=5)), ("2h", timedelta(hours=2)),
+                       ("3 d", timedelta(days=3)), ("1w", timedelta(weeks=1))]:
+        parsed = datetime.fromisoformat(parse_linkedin_date(raw))
+        assert abs((datetime.now() - delta) - parsed) < timedelta(seconds=5)
+    assert parse_linkedin_date("") is None
+    assert parse_linkedin_date("not a date") is None
+
+def test_extract_numbers_from_text():
+    assert extract_numbers_from_text("15 reactions") == 15
+    assert extract_numbers_from_text("1.2K likes") == 1200
+    assert extract_numbers_from_text("3M views") == 3000000
+    assert extract_numbers_from_text("1,234 comments") == 1234
+    assert extract_numbers_from_text("3 members") == 3
+    assert extract_numbers_from_text("5 comments 1.2K likes") == 1200
+    assert extract_numbers_from_text("2 reposts 3M views") == 3000000
+    assert extract_numbers_from_text("no numbers") == 0
+    assert extract_numbers_from_text("") == 0
+
+def test_parse_linkedin_date_bulk():
+    samples = ["2h", "2024-05-01", "2024-05-01T10:00:00Z", "not a date"] * 2500
+    parsed = [parse_linkedin_date(s) for s in samples]
+    assert len(parsed) == len(samples)
+    two_hours_ago = datetime.now() - timedelta(hours=2)
+    assert parsed[1::4] == ["2024-05-01T00:00:00"] * 2500
+    assert parsed[2::4] == ["2024-05-01T10:00:00+00:00"] * 2500
+    assert parsed[3::4] == [None] * 2500
+    assert all(abs(datetime.fromisoformat(v) - two_hours_ago) < timedelta(seconds=5) for v in parsed[0::4])
+
+def test_format_timestamp_iso():
+    assert format_timestamp_iso("2024-05-01T10:00:00Z") == "2024-05-01T10:00:00Z"
+    assert format_timestamp_iso("2024-05-01T10:00:00") == "2024-05-01T10:00:00Z"
+    assert format_timestamp_iso("2024-05-01 10:00:00") == "2024-05-01T10:00:00Z"
+    assert format_timestamp_iso("2024-05-01") == "2024-05-01T00:00:00Z"
+    assert format_timestamp_iso("May 01, 2024") == "2024-05-01T00:00:00Z"
+    assert format_timestamp_iso("Today") == "Today"
+    assert format_timestamp_iso("") == ""
+
+def test_sanitize_filename():
+    assert sanitize_filename('a<b>c:d"e/f\\g|h?i*j.png') == "a_b_c_d_e_f_g_h_i_j.png"
+    assert sanitize_filename("plain_name.jpg") == "plain_name.jpg"
+    long_name = sanitize_filename("x" * 150 + ".jpg")
+    assert long_name == "x" * 95 + ".jpg"
+
+def test_parse_relative_time():
+    now = datetime(2025, 1, 10)
+    assert parse_relative_time("45s", now) == now - timedelta(seconds=45)
+    assert parse_relative_time("2h", now) == now - timedelta(hours=2)
+    assert parse_relative_time("3 w", now) == now - timedelta(weeks=3)
+    assert parse_relative_time("5m ago", now) == now - timedelta(minutes=5)
+    assert parse_relative_time("2024-01-01", now) is None
+    assert parse_relative_time("   ", now) is None
+
+def test_detect_post_type():
+    assert detect_post_type("anything", ["https://x/a.jpg"], {}) == "image_post"
+    assert detect_post_type("Watch our new VIDEO", [], {}) == "video_post"
+    assert detect_post_type("Read https://example.com/post", [], {}) == "article_share"
+    assert detect_post_type("Quick poll for the team", [], {}) == "poll"
+    assert detect_post_type("Just text", [], {}) == "text_post"
+    assert detect_post_type("", [], {}) == "text_post"
+
+def test_split_author_name():
+    assert split_author_name("Dr. Sarah Johnson") == ("Sarah", "Johnson")
+    assert split_author_name("Prof John Van Der Berg") == ("John", "Van Der Berg")
+    assert split_author_name("Drake Smith") == ("Drake", "Smith")
+    assert split_author_name("Mrs.Jane Doe") == ("Jane", "Doe")
+    assert split_author_name("Dr Jane Doe") == ("Jane", "Doe")
+    assert split_author_name("Mr Smith") == ("Mr", "Smith")
+    assert split_author_name("LinkedIn User") == ("LinkedIn User", "")
+    assert split_author_name(float("nan")) == ("", "")
+    assert split_author_name(None) == ("", "")
+
+def test_format_file_size():
+    assert format_file_size(0) == "0.0 B"
+    assert format_file_size(1023) == "1023.0 B"
+    assert format_file_size(1536) == "1.5 KB"
+    assert format_file_size(5 * 1024 ** 2) == "5.0 MB"
+    assert format_file_size(3 * 1024 ** 5) == "3072.0 TB"
+
+def test_create_search_url_encodes_keywords():
+    assert create_search_url(["AI"]) == "https://www.linkedin.com/search/results/content/?keywords=AI"
+    assert create_search_url(["R&D", " machine learning "], "people") == (
+        "https://www.linkedin.com/search/results/people/?keywords=%22R%26D%22+OR+%22machine+learning%22"
+    )
+
+def test_calculate_relative_time_buckets():
+    now = datetime(2025, 1, 10)
+    def ago(seconds):
+        return calculate_relative_time((now - timedelta(seconds=seconds)).isoformat() + "Z", now)
+    assert ago(30) == "just now"
+    assert ago(60) == "1 minute ago"
+    assert ago(3599) == "59 minutes ago"
+    assert ago(7200) == "2 hours ago"
+    assert ago(86400) == "1 day ago"
+    assert ago(604800 * 2) == "2 weeks ago"
+    assert ago(2629746 * 3) == "3 months ago"
+
+def test_extract_hashtags_and_mentions_dedupe_case_insensitively():
+    assert extract_hashtags("#AI #ml #ai #ML #data") == ["AI", "ml", "data"]
+    assert extract_mentions("@jane-doe @Bob @JANE-DOE") == ["jane-doe", "Bob"]
+    assert extract_hashtags("") == []
+
+def test_create_directories(tmp_path):
+    base = tmp_path / "out"
+    create_directories(str(base), ["images", "data/raw"])
+    create_directories(str(base), ["images", "data/raw"])
+    assert (base / "images").is_dir() and (base / "data" / "raw").is_dir()
+    create_directories(str(tmp_path / "bare"), [])
+    assert (tmp_path / "bare").is_dir()
+    (base / "images").rmdir()
+    create_directories(str(base), ["images"])
+    assert (base / "images").is_dir()
+
+def test_validate_environment_variables(monkeypatch):
+    monkeypatch.setenv("LINKEDIN_EMAIL", "a@b.c")
+    monkeypatch.setenv("LINKEDIN_PASSWORD", "")
+    monkeypatch.delenv("SEARCH_KEYWORDS", raising=False)
+    assert validate_environment_variables() == ["LINKEDIN_PASSWORD", "SEARCH_KEYWORDS"]
+    monkeypatch.setenv("SEARCH_KEYWORDS", "AI")
+    assert validate_environment_variables() == ["LINKEDIN_PASSWORD"]
+
+def test_save_dataframe_round_trips(tmp_path):
+    df = pd.DataFrame({"author_name": ["Jane Doe", "Doe, John"], "company": ["x", 'Say "hi"'], "likes": [3, 5]})
+    save_dataframe(df, tmp_path / "posts.csv")
+    assert pd.read_csv(tmp_path / "posts.csv").equals(df)
+
+def test_save_dataframe_mixed_types_falls_back(tmp_path):
+    df = pd.DataFrame({"author_name": ["Jane Doe", "Bo"], "likes": [3, "1.2K"]})
+    save_dataframe(df, tmp_path / "posts.csv")
+    assert pd.read_csv(tmp_path / "posts.csv")["likes"].tolist() == ["3", "1.2K"]
+
+def test_is_valid_image_url():
+    assert is_valid_image_url("https://media.licdn.com/a/b.jpg")
+    assert is_valid_image_url("HTTPS://A/B.PNG")
+    assert is_valid_image_url("ftp://host/x.gif")
+    assert not is_valid_image_url("http:///x.png")
+    assert not is_valid_image_url("/local/x.png")
+    assert not is_valid_image_url("https://host/page.html")
+    assert not is_valid_image_url("")
+
+def test_save_json_datetimes_match_with_and_without_orjson(tmp_path, monkeypatch):
+    data = {"scraped_at": datetime(2024, 1, 1), "posted": datetime(2024, 1, 1, 10, 0, 0, 123456), "n": 1}
+    save_json(tmp_path / "fast.json", data)
+    monkeypatch.setattr("utils.orjson", None)
+    save_json(tmp_path / "plain.json", data)
+    plain = json.loads((tmp_path / "plain.json").read_text())
+    assert plain == {"scraped_at": "2024-01-01T00:00:00", "posted": "2024-01-01T10:00:00.123456", "n": 1}
+    assert json.loads((tmp_path / "fast.json").read_text()) == plain
@@ -3,14 +3,100 @@ Utility functions for LinkedIn scraper
 """
 import re
 import os
+import json
 import asyncio
-import random
 from typing import List, Dict, Optional, Union, Tuple, Callable, Any
-from datetime import datetime, timedelta
-from urllib.parse import urlparse, urljoin
+from datetime import date, datetime, timedelta
+from urllib.parse import urlparse, urljoin, quote_plus
 import logging
 import itertools
 import time
+from collections import deque
+from bisect import bisect_right
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # optional fast JSON encoder
+    orjson = None
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:  # optional C ISO 8601 parser
+    _parse_iso = datetime.fromisoformat
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # optional multi-threaded CSV writer / Parquet support
+    pa = None
+
+# Precompiled patterns for the per-post text helpers
+_RE_SEE_MORE = re.compile(r'…see more$')
+_RE_SHOW_MORE = re.compile(r'Show more$')
+# Number with an optional K/M suffix directly attached, e.g. '15', '1.2K', '3m'
+# K/M-suffixed counts ('1.2K', '3m'), tried in this order before any plain number
+_SUFFIXED_NUMBER_RES = (
+    (re.compile(r'(\d+(?:\.\d+)?)k', re.I), 1000),
+    (re.compile(r'(\d+(?:\.\d+)?)m', re.I), 1000000),
+)
+_RE_NUMBER = re.compile(r'\d+')
+_RE_TIME = re.compile(r'(\d+)\s*([mhdw])')
+_TIME_UNIT_SECONDS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+_RE_REL_TIME = re.compile(r'(\d+)\s*([smhdw])')
+_RE_HASHTAG = re.compile(r'#(\w+)')
+_RE_MENTION = re.compile(r'@([\w\-]+)')
+_RE_URL = re.compile(r'https?://\S+')
+# One leading title stripped before splitting author names: 'Dr.', 'Prof.', 'Mr.', 'Mrs.', 'Ms.',
+# or undotted 'Dr'/'Prof' followed by a space ('Mr Smith' is left alone, 'Drake' keeps its 'Dr')
+_RE_TITLE_PREFIX = re.compile(r'^(?:(?:Dr|Prof|Mrs|Mr|Ms)\.\s*|(?:Dr|Prof)\s+)')
+_RE_VIDEO = re.compile('video|watch|youtube|vimeo|' + re.escape('▶️') + '|🎥', re.I)
+_RE_POLL = re.compile('poll|vote|survey|📊|' + re.escape('🗳️'), re.I)
+# (upper bound in seconds, divisor, unit) buckets for "N units ago" strings
+_REL_BUCKETS = (
+    (3600, 60, 'minute'),
+    (86400, 3600, 'hour'),
+    (604800, 86400, 'day'),
+    (2629746, 604800, 'week'),  # 1 month = 30.44 days
+    (float('inf'), 2629746, 'month'),
+)
+_REL_THRESHOLDS = tuple(bucket[0] for bucket in _REL_BUCKETS)
+
+# Characters not allowed in filenames, mapped to '_'
+_INVALID_FILENAME_CHARS = frozenset('<>:"/\\|?*')
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in _INVALID_FILENAME_CHARS})
+
+# Dates shaped like ISO 8601 ('2024-05-01', '2024-05-01 10:00:00', ...) go straight to the ISO parser
+_RE_ISO_DATE = re.compile(r'\d{4}-\d{2}-\d{2}(?:[ T].*)?')
+_COMMON_DATE_FORMATS = (
+    '%Y-%m-%d',
+    '%Y-%m-%d %H:%M:%S',
+    '%d/%m/%Y',
+    '%m/%d/%Y',
+    '%B %d, %Y',
+    '%b %d, %Y'
+)
+
+_SEARCH_BASE_URLS = {
+    'content': 'https://www.linkedin.com/search/results/content/',
+    'people': 'https://www.linkedin.com/search/results/people/',
+    'companies': 'https://www.linkedin.com/search/results/companies/'
+}
+
+# Environment variables every scraper entry point needs, in reporting order
+_REQUIRED_ENV_VARS = ('LINKEDIN_EMAIL', 'LINKEDIN_PASSWORD', 'SEARCH_KEYWORDS')
+
+# Pre-generated uniform [0, 1) draws for random_delay, scaled to each call's range
+_DELAY_POOL = deque()
+_DELAY_POOL_SIZE = 256
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# 'scheme://' followed by at least one host character, as urlparse would require of scheme + netloc
+_RE_SCHEME_HOST = re.compile(r'[a-z][a-z0-9+.-]*://[^/?#]')
+_IMG_EXTS = ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg')
+_VALID_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp'})
 
 # In-memory round-robin for proxies
 class ProxyRotator:
@@ -127,35 +213,27 @@ def extract_numbers_from_text(text: str) -> int:
     if not text:
         return 0
     
-    # Handle K (thousands) and M (millions) abbreviations
-    text = text.lower().replace(',', '')
+    text = text.replace(',', '')
     
-    if 'k' in text:
-        numbers = re.findall(r'(\d+\.?\d*)k', text)
-        if numbers:
-            return int(float(numbers[0]) * 1000)
-    
-    if 'm' in text:
-        numbers = re.findall(r'(\d+\.?\d*)m', text)
-        if numbers:
-            return int(float(numbers[0]) * 1000000)
+    # Handle K (thousands) and M (millions) abbreviations first, wherever they appear
+    for pattern, multiplier in _SUFFIXED_NUMBER_RES:
+        match = pattern.search(text)
+        if match:
+            return int(float(match.group(1)) * multiplier)
     
     # Extract regular numbers
-    numbers = re.findall(r'\d+', text)
-    return int(numbers[0]) if numbers else 0
+    match = _RE_NUMBER.search(text)
+    return int(match.group()) if match else 0
 
 
 def dedupe_posts(posts: List[Dict]) -> List[Dict]:
     """De-duplicate posts by stable keys (post_url preferred; fallback to content+author+date)."""
-    seen = set()
-    result = []
+    # dicts keep insertion order, so setdefault keeps the first post seen per key
+    seen: Dict[str, Dict] = {}
     for p in posts:
         key = p.get('post_url') or f"{p.get('content','')[:80]}|{p.get('author_name','')}|{p.get('post_date','')}"
-        if key in seen:
-            continue
-        seen.add(key)
-        result.append(p)
-    return result
+        seen.setdefault(key, p)
+    return list(seen.values())
 
 
 def clean_posts(posts: List[Dict]) -> List[Dict]:
@@ -184,11 +262,11 @@ def clean_text(text: str) -> str:
         return ""
     
     # Remove extra whitespace and newlines
-    text = re.sub(r'\s+', ' ', text.strip())
+    text = ' '.join(text.split())
     
     # Remove common LinkedIn artifacts
-    text = re.sub(r'…see more$', '', text)
-    text = re.sub(r'Show more$', '', text)
+    text = _RE_SEE_MORE.sub('', text)
+    text = _RE_SHOW_MORE.sub('', text)
     
     return text.strip()
 
@@ -207,32 +285,18 @@ def parse_linkedin_date(date_str: str) -> Optional[str]:
         return None
     
     try:
+        lowered = date_str.lower()
+        now = datetime.now()
+        
         # Handle different LinkedIn date formats
-        if 'now' in date_str.lower():
-            return datetime.now().isoformat()
-        
-        # Extract time units (minutes, hours, days, weeks)
-        time_patterns = {
-            r'(\d+)\s*m': 'minutes',
-            r'(\d+)\s*h': 'hours', 
-            r'(\d+)\s*d': 'days',
-            r'(\d+)\s*w': 'weeks'
-        }
-        
-        for pattern, unit in time_patterns.items():
-            match = re.search(pattern, date_str.lower())
-            if match:
-                value = int(match.group(1))
-                if unit == 'minutes':
-                    date = datetime.now() - timedelta(minutes=value)
-                elif unit == 'hours':
-                    date = datetime.now() - timedelta(hours=value)
-                elif unit == 'days':
-                    date = datetime.now() - timedelta(days=value)
-                elif unit == 'weeks':
-                    date = datetime.now() - timedelta(weeks=value)
-                
-                return date.isoformat()
+        if 'now' in lowered:
+            return now.isoformat()
+        
+        # Extract time units (minutes, hours, days, weeks) in a single scan
+        match = _RE_TIME.search(lowered)
+        if match:
+            seconds = int(match.group(1)) * _TIME_UNIT_SECONDS[match.group(2)]
+            return (now - timedelta(seconds=seconds)).isoformat()
         
         # Try to parse ISO format directly
         return datetime.fromisoformat(date_str.replace('Z', '+00:00')).isoformat()
@@ -254,20 +318,19 @@ def is_valid_image_url(url: str) -> bool:
     if not url:
         return False
     
-    try:
-        parsed = urlparse(url)
-        if not parsed.scheme or not parsed.netloc:
-            return False
-        
-        # Check for image file extensions
-        image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg']
-        return any(url.lower().endswith(ext) for ext in image_extensions)
-        
-    except Exception:
-        return False
+    # Scheme + non-empty host, then the extension - no need for a full urlparse per image
+    lowered = url.lower()
+    return _RE_SCHEME_HOST.match(lowered) is not None and lowered.endswith(_IMG_EXTS)
+
 
+@lru_cache(maxsize=8192)
+def _ext_for(url: str) -> str:
+    """Image extension for a URL (default .jpg), cached since CDN URLs repeat across posts"""
+    ext = os.path.splitext(urlparse(url).path)[1].lower()
+    return ext if ext in _VALID_EXTS else '.jpg'
 
-def generate_filename(post_index: int, image_index: int, url: str) -> str:
+
+def generate_filename(post_index: int, image_index: int, url: str, timestamp: Optional[str] = None) -> str:
     """
     Generate a unique filename for downloaded images
     
@@ -275,21 +338,17 @@ def generate_filename(post_index: int, image_index: int, url: str) -> str:
         post_index: Index of the post
         image_index: Index of the image in the post
         url: Original image URL
+        timestamp: Precomputed '%Y%m%d_%H%M%S' stamp; pass one per download
+            batch to avoid formatting the clock for every image
         
     Returns:
         Generated filename
     """
-    # Extract file extension from URL
-    parsed = urlparse(url)
-    path = parsed.path.lower()
-    
-    extension = '.jpg'  # default
-    for ext in ['.jpg', '.jpeg', '.png', '.gif', '.webp']:
-        if ext in path:
-            extension = ext
-            break
+    # Extract file extension from URL (default .jpg)
+    extension = _ext_for(url)
     
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    if timestamp is None:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     return f"post_{post_index:04d}_img_{image_index:02d}_{timestamp}{extension}"
 
 
@@ -301,13 +360,11 @@ def create_directories(base_path: str, subdirs: List[str]) -> None:
         base_path: Base directory path
         subdirs: List of subdirectories to create
     """
-    from pathlib import Path
-    
     base = Path(base_path)
-    base.mkdir(exist_ok=True)
     
-    for subdir in subdirs:
-        (base / subdir).mkdir(exist_ok=True)
+    # parents=True creates base along with the first subdir
+    for path in [base / subdir for subdir in subdirs] or [base]:
+        path.mkdir(parents=True, exist_ok=True)
 
 
 async def random_delay(min_seconds: float = 1.0, max_seconds: float = 3.0) -> None:
@@ -318,7 +375,10 @@ async def random_delay(min_seconds: float = 1.0, max_seconds: float = 3.0) -> No
         min_seconds: Minimum delay in seconds
         max_seconds: Maximum delay in seconds
     """
-    delay = random.uniform(min_seconds, max_seconds)
+    if not _DELAY_POOL:
+        import numpy as np
+        _DELAY_POOL.extend(np.random.random(_DELAY_POOL_SIZE).tolist())
+    delay = min_seconds + _DELAY_POOL.popleft() * (max_seconds - min_seconds)
     await asyncio.sleep(delay)
 
 
@@ -329,18 +389,8 @@ def validate_environment_variables() -> List[str]:
     Returns:
         List of missing environment variables
     """
-    required_vars = [
-        'LINKEDIN_EMAIL',
-        'LINKEDIN_PASSWORD',
-        'SEARCH_KEYWORDS'
-    ]
-    
-    missing_vars = []
-    for var in required_vars:
-        if not os.getenv(var):
-            missing_vars.append(var)
-    
-    return missing_vars
+    environ = os.environ
+    return [var for var in _REQUIRED_ENV_VARS if not environ.get(var)]
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -353,11 +403,12 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Formatted size string
     """
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.1f} B"
+    
+    # 1024 == 2**10, so the unit index is the bit length in steps of 10
+    idx = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * idx)):.1f} {_SIZE_UNITS[idx]}"
 
 
 def sanitize_filename(filename: str) -> str:
@@ -370,10 +421,9 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    # Remove invalid characters
-    invalid_chars = r'<>:"/\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
+    # Remove invalid characters (most names have none, so only build a new string when needed)
+    if not _INVALID_FILENAME_CHARS.isdisjoint(filename):
+        filename = filename.translate(_SANITIZE_TABLE)
     
     # Limit length
     if len(filename) > 100:
@@ -394,23 +444,66 @@ def create_search_url(keywords: List[str], search_type: str = 'content') -> str:
     Returns:
         Formatted search URL
     """
-    base_urls = {
-        'content': 'https://www.linkedin.com/search/results/content/',
-        'people': 'https://www.linkedin.com/search/results/people/',
-        'companies': 'https://www.linkedin.com/search/results/companies/'
-    }
-    
-    base_url = base_urls.get(search_type, base_urls['content'])
+    base_url = _SEARCH_BASE_URLS.get(search_type, _SEARCH_BASE_URLS['content'])
     
     # Format keywords for LinkedIn search
     if len(keywords) == 1:
-        query = f'?keywords={keywords[0].strip()}'
+        formatted_keywords = keywords[0].strip()
     else:
         # Use OR for multiple keywords
-        formatted_keywords = ' OR '.join([f'"{kw.strip()}"' for kw in keywords])
-        query = f'?keywords={formatted_keywords}'
+        formatted_keywords = ' OR '.join(f'"{kw.strip()}"' for kw in keywords)
+    
+    # URL-encode so spaces, quotes, '&' and '=' in keywords can't break the query string
+    return f'{base_url}?keywords={quote_plus(formatted_keywords)}'
+
+
+def _json_default(obj: Any) -> str:
+    """Stringify what json can't encode, writing dates/datetimes in ISO form as orjson does"""
+    return obj.isoformat() if isinstance(obj, date) else str(obj)
+
+
+def save_json(path: Union[str, Path], data: Any) -> None:
+    """
+    Write data as indented UTF-8 JSON, using orjson when it is installed
+    
+    Args:
+        path: Output file path
+        data: JSON-serializable data (unknown types are stringified)
+    """
+    if orjson is not None:
+        Path(path).write_bytes(
+            orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False, default=_json_default)
+
+
+def save_dataframe(df, csv_path: Union[str, Path]) -> None:
+    """
+    Write a DataFrame to CSV, plus a zstd Parquet copy alongside when pyarrow can type every column
+    
+    Args:
+        df: pandas DataFrame to save
+        csv_path: Output CSV path (the Parquet file shares its stem)
+    """
+    if pa is None:
+        df.to_csv(csv_path, index=False, encoding='utf-8')
+        return
     
-    return base_url + query
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed-type object columns (e.g. likes = [3, '1.2K']) have no Arrow type; pandas writes them fine
+        df.to_csv(csv_path, index=False, encoding='utf-8')
+        return
+    # Arrow can't write nested columns (e.g. hashtag lists) to CSV; stringify them like pandas does
+    for i, field in enumerate(table.schema):
+        if pa.types.is_nested(field.type):
+            table = table.set_column(i, field.name, pa.array(df[field.name].astype(str)))
+    # Note: Arrow quotes every string field ("Jane Doe",""); readers parse it the same as pandas' output
+    pa_csv.write_csv(table, str(csv_path))
+    df.to_parquet(Path(csv_path).with_suffix('.parquet'), index=False, compression='zstd')
 
 
 def estimate_scraping_time(max_posts: int, delay_avg: float = 3.0) -> str:
@@ -450,9 +543,8 @@ def split_author_name(full_name: str) -> Tuple[str, str]:
     Returns:
         Tuple of (firstName, lastName)
     """
-    import pandas as pd
-    
-    if not full_name or pd.isna(full_name) or str(full_name).strip() == "":
+    # NaN (x != x) shows up here for empty CSV cells
+    if not full_name or (isinstance(full_name, float) and full_name != full_name) or str(full_name).strip() == "":
         return "", ""
     
     # Clean the name (remove extra whitespace and common prefixes)
@@ -463,10 +555,7 @@ def split_author_name(full_name: str) -> Tuple[str, str]:
         return cleaned_name, ""
     
     # Remove common prefixes and titles
-    prefixes = ['Dr.', 'Prof.', 'Mr.', 'Mrs.', 'Ms.', 'Dr', 'Prof']
-    for prefix in prefixes:
-        if cleaned_name.startswith(prefix):
-            cleaned_name = cleaned_name[len(prefix):].strip()
+    cleaned_name = _RE_TITLE_PREFIX.sub('', cleaned_name)
     
     # Split by space and handle different cases
     name_parts = cleaned_name.split()
@@ -486,6 +575,16 @@ def split_author_name(full_name: str) -> Tuple[str, str]:
         return first_name, last_name
 
 
+def _dedupe_casefold(items: List[str]) -> List[str]:
+    """Drop case-insensitive repeats, keeping the first spelling of each item in order"""
+    if len(items) < 2:
+        return list(items)
+    seen = {}
+    for item in items:
+        seen.setdefault(item.lower(), item)
+    return list(seen.values())
+
+
 def extract_hashtags(text: str) -> List[str]:
     """
     Extract hashtags from post content
@@ -500,19 +599,10 @@ def extract_hashtags(text: str) -> List[str]:
         return []
     
     # Use regex to find hashtags (# followed by word characters)
-    hashtag_pattern = r'#(\w+)'
-    hashtags = re.findall(hashtag_pattern, text, re.IGNORECASE)
+    hashtags = _RE_HASHTAG.findall(text)
     
     # Remove duplicates while preserving order
-    unique_hashtags = []
-    seen = set()
-    for hashtag in hashtags:
-        hashtag_lower = hashtag.lower()
-        if hashtag_lower not in seen:
-            seen.add(hashtag_lower)
-            unique_hashtags.append(hashtag)
-    
-    return unique_hashtags
+    return _dedupe_casefold(hashtags)
 
 
 def extract_mentions(text: str) -> List[str]:
@@ -529,27 +619,19 @@ def extract_mentions(text: str) -> List[str]:
         return []
     
     # Use regex to find mentions (@ followed by word characters, allowing hyphens and underscores)
-    mention_pattern = r'@([\w\-_]+)'
-    mentions = re.findall(mention_pattern, text, re.IGNORECASE)
+    mentions = _RE_MENTION.findall(text)
     
     # Remove duplicates while preserving order
-    unique_mentions = []
-    seen = set()
-    for mention in mentions:
-        mention_lower = mention.lower()
-        if mention_lower not in seen:
-            seen.add(mention_lower)
-            unique_mentions.append(mention)
-    
-    return unique_mentions
+    return _dedupe_casefold(mentions)
 
 
-def format_timestamp_iso(timestamp_str: str) -> str:
+def format_timestamp_iso(timestamp_str: str, now: Optional[datetime] = None) -> str:
     """
     Convert various timestamp formats to ISO format
     
     Args:
         timestamp_str: Raw timestamp string from LinkedIn
+        now: Reference time for relative strings (defaults to datetime.now())
         
     Returns:
         ISO formatted timestamp string
@@ -562,28 +644,21 @@ def format_timestamp_iso(timestamp_str: str) -> str:
         if 'T' in timestamp_str and timestamp_str.endswith('Z'):
             return timestamp_str
         
-        # Handle LinkedIn datetime attributes (usually already ISO)
-        if 'T' in timestamp_str:
-            # Try to parse and re-format to ensure consistency
-            dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            return dt.isoformat() + 'Z'
+        # Handle LinkedIn datetime attributes and other ISO-shaped dates with one C-level parse
+        if 'T' in timestamp_str or _RE_ISO_DATE.fullmatch(timestamp_str):
+            try:
+                dt = _parse_iso(timestamp_str.replace('Z', '+00:00'))
+                return dt.isoformat() + 'Z'
+            except ValueError:
+                pass  # Not ISO after all - fall through to the slower parsers
         
         # Handle relative time strings (e.g., "2h", "1d", "3w")
-        relative_time = parse_relative_time(timestamp_str)
+        relative_time = parse_relative_time(timestamp_str, now)
         if relative_time:
             return relative_time.isoformat() + 'Z'
         
         # Try to parse common date formats
-        common_formats = [
-            '%Y-%m-%d',
-            '%Y-%m-%d %H:%M:%S',
-            '%d/%m/%Y',
-            '%m/%d/%Y',
-            '%B %d, %Y',
-            '%b %d, %Y'
-        ]
-        
-        for fmt in common_formats:
+        for fmt in _COMMON_DATE_FORMATS:
             try:
                 dt = datetime.strptime(timestamp_str, fmt)
                 return dt.isoformat() + 'Z'
@@ -597,12 +672,13 @@ def format_timestamp_iso(timestamp_str: str) -> str:
         return timestamp_str
 
 
-def calculate_relative_time(timestamp_str: str) -> str:
+def calculate_relative_time(timestamp_str: str, now: Optional[datetime] = None) -> str:
     """
     Calculate relative time from timestamp (e.g., "2 hours ago", "1 day ago")
     
     Args:
         timestamp_str: ISO timestamp string
+        now: Reference time (defaults to datetime.now())
         
     Returns:
         Human-readable relative time string
@@ -613,12 +689,12 @@ def calculate_relative_time(timestamp_str: str) -> str:
     try:
         # Parse the timestamp
         if timestamp_str.endswith('Z'):
-            dt = datetime.fromisoformat(timestamp_str[:-1])
+            dt = _parse_iso(timestamp_str[:-1])
         else:
-            dt = datetime.fromisoformat(timestamp_str)
+            dt = _parse_iso(timestamp_str)
         
         # Calculate time difference
-        now = datetime.now()
+        now = now or datetime.now()
         diff = now - dt
         
         # Calculate relative time
@@ -626,32 +702,22 @@ def calculate_relative_time(timestamp_str: str) -> str:
         
         if seconds < 60:
             return "just now"
-        elif seconds < 3600:  # Less than 1 hour
-            minutes = int(seconds // 60)
-            return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
-        elif seconds < 86400:  # Less than 1 day
-            hours = int(seconds // 3600)
-            return f"{hours} hour{'s' if hours != 1 else ''} ago"
-        elif seconds < 604800:  # Less than 1 week
-            days = int(seconds // 86400)
-            return f"{days} day{'s' if days != 1 else ''} ago"
-        elif seconds < 2629746:  # Less than 1 month (30.44 days)
-            weeks = int(seconds // 604800)
-            return f"{weeks} week{'s' if weeks != 1 else ''} ago"
-        else:
-            months = int(seconds // 2629746)
-            return f"{months} month{'s' if months != 1 else ''} ago"
+        
+        _, divisor, unit = _REL_BUCKETS[bisect_right(_REL_THRESHOLDS, seconds)]
+        count = int(seconds // divisor)
+        return f"{count} {unit}{'s' if count != 1 else ''} ago"
             
     except Exception:
         return ""
 
 
-def parse_relative_time(relative_str: str) -> Optional[datetime]:
+def parse_relative_time(relative_str: str, now: Optional[datetime] = None) -> Optional[datetime]:
     """
     Parse LinkedIn relative time strings (e.g., "2h", "1d", "3w") to datetime
     
     Args:
         relative_str: Relative time string from LinkedIn
+        now: Reference time (defaults to datetime.now())
         
     Returns:
         Datetime object or None if parsing fails
@@ -663,31 +729,18 @@ def parse_relative_time(relative_str: str) -> Optional[datetime]:
         # Clean the string
         clean_str = relative_str.strip().lower()
         
-        # Extract number and unit
-        pattern = r'(\d+)\s*([smhdw])'
-        match = re.match(pattern, clean_str)
-        
-        if not match:
-            return None
-        
-        number = int(match.group(1))
-        unit = match.group(2)
+        # Extract number and unit - bare "2h"/"1d" needs no regex
+        unit = clean_str[-1]
+        number_str = clean_str[:-1].rstrip()
+        if not (unit in _TIME_UNIT_SECONDS and number_str.isdecimal()):
+            match = _RE_REL_TIME.match(clean_str)
+            if not match:
+                return None
+            number_str, unit = match.groups()
         
         # Calculate timedelta
-        now = datetime.now()
-        
-        if unit == 's':  # seconds
-            return now - timedelta(seconds=number)
-        elif unit == 'm':  # minutes
-            return now - timedelta(minutes=number)
-        elif unit == 'h':  # hours
-            return now - timedelta(hours=number)
-        elif unit == 'd':  # days
-            return now - timedelta(days=number)
-        elif unit == 'w':  # weeks
-            return now - timedelta(weeks=number)
-        
-        return None
+        now = now or datetime.now()
+        return now - timedelta(seconds=int(number_str) * _TIME_UNIT_SECONDS[unit])
         
     except Exception:
         return None
@@ -706,43 +759,38 @@ def detect_post_type(content: str, image_urls: List[str], post_data: Dict) -> st
         Post type string ('text', 'image', 'video', 'article_share', 'poll')
     """
     # Check for images
-    if image_urls and len(image_urls) > 0:
+    if image_urls:
         return 'image_post'
     
-    # Check for video indicators in content or URLs
-    if content:
-        video_indicators = ['video', 'watch', 'youtube', 'vimeo', '▶️', '🎥']
-        if any(indicator in content.lower() for indicator in video_indicators):
-            return 'video_post'
-    
-    # Check for article shares (external links)
-    if content:
-        # Look for URLs in content
-        url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-        urls = re.findall(url_pattern, content)
-        if urls:
-            return 'article_share'
-    
-    # Check for poll indicators
-    if content:
-        poll_indicators = ['poll', 'vote', 'survey', '📊', '🗳️']
-        if any(indicator in content.lower() for indicator in poll_indicators):
-            return 'poll'
+    if not content:
+        return 'text_post'
+    
+    # Check for video indicators, then article shares (external links), then polls
+    if _RE_VIDEO.search(content):
+        return 'video_post'
+    
+    if _RE_URL.search(content):
+        return 'article_share'
+    
+    if _RE_POLL.search(content):
+        return 'poll'
     
     # Default to text post
     return 'text_post'
 
 
-def enhance_post_data(post_data: Dict) -> Dict:
+def enhance_post_data(post_data: Dict, now: Optional[datetime] = None) -> Dict:
     """
     Enhance post data with additional computed fields
     
     Args:
         post_data: Original post data dictionary
+        now: Reference time for timestamps and metadata (defaults to datetime.now())
         
     Returns:
         Enhanced post data dictionary with additional fields
     """
+    now = now or datetime.now()
     enhanced_data = post_data.copy()
     
     # 1. Split author name into firstName and lastName
@@ -762,9 +810,9 @@ def enhance_post_data(post_data: Dict) -> Dict:
     
     # 4. Format timestamp to ISO and calculate relative time
     post_date = post_data.get('timestamp', '') or post_data.get('post_date', '')
-    iso_timestamp = format_timestamp_iso(post_date)
+    iso_timestamp = format_timestamp_iso(post_date, now)
     enhanced_data['postedAtISO'] = iso_timestamp
-    enhanced_data['timeSincePosted'] = calculate_relative_time(iso_timestamp)
+    enhanced_data['timeSincePosted'] = calculate_relative_time(iso_timestamp, now)
     
     # 5. Detect post type
     image_urls = post_data.get('image_urls', [])
@@ -772,7 +820,23 @@ def enhance_post_data(post_data: Dict) -> Dict:
     enhanced_data['post_type'] = post_type
     
     # 6. Add metadata
-    enhanced_data['enhanced_at'] = datetime.now().isoformat() + 'Z'
+    enhanced_data['enhanced_at'] = now.isoformat() + 'Z'
     enhanced_data['enhancement_version'] = '1.0'
     
     return enhanced_data
+
+
+def enhance_posts_batch(posts: List[Dict], now: Optional[datetime] = None) -> List[Dict]:
+    """
+    Enhance a batch of posts against a single clock snapshot
+    
+    Args:
+        posts: List of post data dictionaries
+        now: Reference time shared by every post (defaults to datetime.now())
+        
+    Returns:
+        List of enhanced post data dictionaries
+    """
+    now = now or datetime.now()
+    return [enhance_post_data(post, now) for post in posts]
+
@@ -16,19 +16,20 @@ print(f"✅ Total data fields: {len(df.columns)}")
 
 print("\n📋 AUTHOR NAME VERIFICATION:")
 print("-" * 30)
-for i, row in df.iterrows():
+NAME_COLUMNS = ['author_name', 'author_firstName', 'author_lastName']
+for i, name, first, last, content in df[NAME_COLUMNS + ['content']].itertuples(name=None):
     print(f"Post {i+1}:")
-    print(f"  Full Name: {row['author_name']}")
-    print(f"  First: {row['author_firstName']}")
-    print(f"  Last: {row['author_lastName']}")
-    print(f"  Content: {row['content'][:50]}...")
+    print(f"  Full Name: {name}")
+    print(f"  First: {first}")
+    print(f"  Last: {last}")
+    print(f"  Content: {content[:50]}...")
     print()
 
 print("📊 DATA QUALITY SUMMARY:")
 print("-" * 30)
-print(f"✅ author_name filled: {df['author_name'].notna().sum()}/{len(df)} ({df['author_name'].notna().sum()/len(df)*100:.1f}%)")
-print(f"✅ author_firstName filled: {df['author_firstName'].notna().sum()}/{len(df)} ({df['author_firstName'].notna().sum()/len(df)*100:.1f}%)")
-print(f"✅ author_lastName filled: {df['author_lastName'].notna().sum()}/{len(df)} ({df['author_lastName'].notna().sum()/len(df)*100:.1f}%)")
+filled = df[NAME_COLUMNS].notna().sum()
+for col, count in filled.items():
+    print(f"✅ {col} filled: {count}/{len(df)} ({count/len(df)*100:.1f}%)")
 
 print("\n🎯 ISSUE RESOLVED!")
 print("✅ Author names are now being extracted correctly")
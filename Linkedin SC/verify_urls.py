@@ -2,12 +2,23 @@
 Verify LinkedIn Post URLs
 Check if the extracted URLs are working correctly
 """
+import asyncio
+import aiohttp
 import pandas as pd
-import requests
 from pathlib import Path
 
+# HEAD requests allowed in flight at once
+MAX_CONCURRENT_CHECKS = 20
 
-def verify_linkedin_urls():
+
+async def check_url(session, semaphore, url):
+    """HEAD a URL (following redirects) and return its status code"""
+    async with semaphore:
+        async with session.head(url, allow_redirects=True) as response:
+            return response.status
+
+
+async def verify_linkedin_urls():
     """Check if LinkedIn URLs from scraping are working"""
     print("🔍 LinkedIn URL Verification")
     print("=" * 50)
@@ -22,27 +33,29 @@ def verify_linkedin_urls():
     print(f"📊 Found {len(df)} posts in CSV")
     print()
     
-    # Check URLs
-    working_urls = 0
-    total_urls = 0
+    # Check URLs - HEAD requests (faster than GET) sharing one keep-alive session, run concurrently
+    post_urls = df['post_url'].dropna().astype(str).str.strip() if 'post_url' in df else pd.Series(dtype=str)
+    post_urls = post_urls[post_urls != ''].tolist()
+    total_urls = len(post_urls)
     
-    for index, row in df.iterrows():
-        post_url = row.get('post_url', '')
-        if pd.notna(post_url) and post_url.strip():
-            total_urls += 1
-            print(f"🔗 Testing URL {total_urls}: {post_url}")
-            
-            try:
-                # Test URL with a HEAD request (faster than GET)
-                response = requests.head(post_url, timeout=10, allow_redirects=True)
-                if response.status_code == 200:
-                    print(f"✅ URL works! (Status: {response.status_code})")
-                    working_urls += 1
-                else:
-                    print(f"❌ URL failed (Status: {response.status_code})")
-            except Exception as e:
-                print(f"❌ URL failed (Error: {str(e)})")
-            print()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHECKS)
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
+        results = await asyncio.gather(
+            *(check_url(session, semaphore, url) for url in post_urls),
+            return_exceptions=True
+        )
+    
+    working_urls = 0
+    for i, (post_url, result) in enumerate(zip(post_urls, results), 1):
+        print(f"🔗 Testing URL {i}: {post_url}")
+        if isinstance(result, Exception):
+            print(f"❌ URL failed (Error: {str(result) or type(result).__name__})")
+        elif result == 200:
+            print(f"✅ URL works! (Status: {result})")
+            working_urls += 1
+        else:
+            print(f"❌ URL failed (Status: {result})")
+        print()
     
     # Summary
     print("📋 VERIFICATION SUMMARY")
@@ -92,5 +105,5 @@ def compare_old_vs_new_format():
 
 
 if __name__ == "__main__":
-    verify_linkedin_urls()
+    asyncio.run(verify_linkedin_urls())
     compare_old_vs_new_format()
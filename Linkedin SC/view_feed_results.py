@@ -4,10 +4,26 @@ LinkedIn Feed Data Viewer
 Shows the enhanced data collected from your LinkedIn feed
 """
 
+import ast
 import pandas as pd
 import json
 from datetime import datetime
 
+SAMPLE_COLUMNS = ['content', 'company', 'hashtags', 'post_type', 'scraped_at', 'likes', 'comments']
+ENGAGEMENT_COLUMNS = ['likes', 'comments', 'shares']
+
+
+def parse_list_cell(value):
+    """Parse a list literal stored in a CSV cell (e.g. "['ai', 'ml']"); anything else becomes []"""
+    if not isinstance(value, str):
+        return []
+    try:
+        parsed = ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return []
+    return parsed if isinstance(parsed, list) else []
+
+
 def view_feed_data():
     """Display collected feed data in a user-friendly format"""
     
@@ -33,15 +49,10 @@ def view_feed_data():
         print("📄 SAMPLE POSTS:")
         print("-" * 40)
         
-        for i in range(min(3, len(df))):
-            post = df.iloc[i]
-            print(f"\\nPost {i+1}:")
-            print(f"  📝 Content: {str(post['content'])[:100]}...")
-            print(f"  🏢 Company: {post['company']}")
-            print(f"  🏷️ Hashtags: {post['hashtags']}")
-            print(f"  👥 Type: {post['post_type']}")
-            print(f"  📅 Scraped: {post['scraped_at']}")
-            print(f"  💬 Engagement: {post['likes']} likes, {post['comments']} comments")
+        # One formatter pass over a truncated view of the first three posts
+        sample = df.head(3)
+        sample = sample.assign(content=sample['content'].astype(str).str[:100] + '...')
+        print(sample[[c for c in SAMPLE_COLUMNS if c in sample.columns]].to_string(index=False))
         
         # Statistics
         print(f"\\n📈 STATISTICS:")
@@ -51,10 +62,11 @@ def view_feed_data():
         post_types = df['post_type'].value_counts() if 'post_type' in df.columns else pd.Series()
         print(f"Post Types: {dict(post_types)}")
         
-        # Total engagement
-        total_likes = df['likes'].sum() if 'likes' in df.columns else 0
-        total_comments = df['comments'].sum() if 'comments' in df.columns else 0
-        total_shares = df['shares'].sum() if 'shares' in df.columns else 0
+        # Total engagement (one sum over the engagement columns that exist)
+        totals = df[[c for c in ENGAGEMENT_COLUMNS if c in df.columns]].sum()
+        total_likes = totals.get('likes', 0)
+        total_comments = totals.get('comments', 0)
+        total_shares = totals.get('shares', 0)
         
         print(f"Total Engagement:")
         print(f"  👍 Likes: {total_likes}")
@@ -62,16 +74,10 @@ def view_feed_data():
         print(f"  🔄 Shares: {total_shares}")
         
         # Hashtag analysis
-        all_hashtags = []
-        for hashtag_str in df['hashtags'].fillna('[]'):
-            try:
-                hashtags = eval(hashtag_str) if isinstance(hashtag_str, str) else []
-                all_hashtags.extend(hashtags)
-            except:
-                pass
+        all_hashtags = df['hashtags'].map(parse_list_cell).explode().dropna()
         
-        if all_hashtags:
-            hashtag_counts = pd.Series(all_hashtags).value_counts().head(10)
+        if not all_hashtags.empty:
+            hashtag_counts = all_hashtags.value_counts().head(10)
             print(f"\\nTop Hashtags: {dict(hashtag_counts)}")
         
         print(f"\\n🎯 ENHANCEMENT FEATURES APPLIED:")
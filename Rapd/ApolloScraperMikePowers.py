@@ -1,42 +1,89 @@
 import re
+from playwright.sync_api import sync_playwright, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+from concurrent.futures import ProcessPoolExecutor
 import csv
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
+import os
+import shutil
 import time
 
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+
+# Apollo selectors
+LOADED_SECTION_SELECTOR = "[data-cy-loaded='true']"
+ROW_SELECTOR = f"{LOADED_SECTION_SELECTOR} tbody"
+REVEAL_BTN_SELECTOR = ".zp-button.zp_zUY3r.zp_hLUWg.zp_n9QPr.zp_B5hnZ.zp_MCSwB.zp_IYteB"
+POPOVER_SELECTOR = "div[role='tooltip']"
+# Id of the popover a reveal button opened, from its ARIA link to it
+POPOVER_ID_JS = "btn => btn.getAttribute('aria-controls') || btn.getAttribute('aria-describedby')"
+NEXT_BUTTON_SELECTOR = ".zp-button.zp_zUY3r.zp_MCSwB.zp_xCVC8[aria-label='right-arrow']"
+
+# Pulls every lead field for all rows of the loaded page in one round trip.
+# Evaluated on the loaded section, with the reveal-email button selector as the argument.
+EXTRACT_ROWS_JS = r"""
+(section, buttonSelector) => Array.from(section.querySelectorAll('tbody')).map((tb, idx) => {
+    const a = Array.from(tb.querySelectorAll('a'));
+    const linkedin = tb.querySelector("a[href*='linkedin.com']");
+    const company = tb.querySelector("a[href*='accounts']");
+    const title = tb.querySelector('.zp_Y6y8d');
+    return {
+        idx,
+        name: a.length ? a[0].innerText : '',
+        linkedin: linkedin ? linkedin.href : '',
+        company: company ? company.innerText : '',
+        phone: a.length ? a[a.length - 1].innerText : '',
+        title: title ? title.innerText : '',
+        has_button: !!tb.querySelector(buttonSelector),
+        // Emails Apollo already shows (e.g. verified contacts) need no reveal click
+        email_inline: (tb.innerText.match(/\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b/g) || [])
+            .filter(e => !e.endsWith('sentry.io'))
+            .slice(0, 2)
+    };
+});
+"""
+
 # In case you forgot how the plugin works check out this video :)
 
 # https://www.youtube.com/watch?v=IgoIQutaVvg
 
 # Make sure to have the following done:
 # Python Installed
-# Selenium Installed
-# Chrome Driver Working
+# Playwright Installed (pip install playwright)
+# Google Chrome installed (the scraper drives your real Chrome so the saved profile works)
 # Input your local user in the user_data_dir
-# Login to apollo on the user instance (run it one time to see if your logged in or not and if not just log in)
+# Login to apollo on the user instance (run it one time with HEADLESS = False to see if your logged in or not and if not just log in)
 
 # And then enjoy :)
 
-chrome_options = Options()
 #user_data_dir = 'C:\Users\dhana\AppData\Local\Google\Chrome\User Data\Default'
-user_data_dir = 'C:\Users\dhana\Downloads\chromedriver-win64\chromedriver-win64'
-chrome_options.add_argument(f"user-data-dir={user_data_dir}")
-chrome_driver_path = 'C:\Users\dhana\Downloads\chromedriver-win64\chromedriver-win64\chromedriver.exe'
-service = Service(chrome_driver_path)
-driver = webdriver.Chrome(service=service, options=chrome_options)
-
-# Link and name of CSV
-driver.get("https://app.apollo.io/#/people?page=1&sortAscending=false&sortByField=%5Bnone%5D&contactEmailStatusV2[]=likely_to_engage&contactEmailStatusV2[]=verified&personLocations[]=United%20Kingdom&organizationNumEmployeesRanges[]=21%2C50&organizationNumEmployeesRanges[]=51%2C100&organizationIndustryTagIds[]=5567ce237369644ee5490000&organizationIndustryTagIds[]=5567cdd67369643e64020000")
+user_data_dir = r'C:\Users\dhana\Downloads\chromedriver-win64\chromedriver-win64'
+
+# Search filters and name of CSV
+SEARCH_FILTERS = "sortAscending=false&sortByField=%5Bnone%5D&contactEmailStatusV2[]=likely_to_engage&contactEmailStatusV2[]=verified&personLocations[]=United%20Kingdom"
+EMPLOYEE_RANGES = ['21%2C50', '51%2C100']
+INDUSTRY_TAG_IDS = ['5567ce237369644ee5490000', '5567cdd67369643e64020000']
 csv_file_name = 'UKCompaniesUpto100Emp.csv'
 
-time.sleep(200)
+# Chrome windows scraping at once (one per shard, each with its own profile copy)
+MAX_WORKERS = 4
+
+# Per-action timeout (ms); an upgrade popup covering the table fails the next click within this
+ACTION_TIMEOUT = 10000
+
+# Headless Chrome without images or GPU; set to False for the first run so you can log in to Apollo
+HEADLESS = True
+CHROME_ARGS = ['--disable-gpu', '--blink-settings=imagesEnabled=false']
+
+# Rows written between flush + fsync of the shard CSV (bounds what a crash can lose)
+FLUSH_EVERY = 50
+
+# Times a page is retried (with 2s, 4s, 8s backoff) after a browser error before the shard gives up
+MAX_PAGE_RETRIES = 3
 
-def find_email_address(page_source):
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    return re.findall(email_pattern, page_source)
+# Third-party telemetry Apollo loads; none of it is needed to read the leads table
+BLOCKED_URLS = ['*sentry.io*', '*segment.io*', '*google-analytics*', '*googletagmanager*', '*doubleclick*']
+
+def find_email_address(text):
+    return EMAIL_RE.findall(text)
 
 def filter_emails(emails, excluded_domain):
     filtered = [email for email in emails if not email.endswith(excluded_domain)]
@@ -48,75 +95,185 @@ def split_name(name):
     last_name = ' '.join(parts[1:]) if len(parts) > 1 else ''
     return first_name, last_name
 
-while True:
-    try:
-        loaded_section_selector = "[data-cy-loaded='true']"
-        loaded_section = driver.find_element(By.CSS_SELECTOR, loaded_section_selector)
-
-        tbodies = loaded_section.find_elements(By.TAG_NAME, 'tbody')
-        if not tbodies:
-            break
-
-        for tbody in tbodies:
-            first_anchor_text = tbody.find_element(By.TAG_NAME, 'a').text
-            first_name, last_name = split_name(first_anchor_text)
-
-            linkedin_url = ''
-            for link in tbody.find_elements(By.TAG_NAME, 'a'):
-                href = link.get_attribute('href')
-                if 'linkedin.com' in href:
-                    linkedin_url = href
-                    break
-
-            job_title_element = tbody.find_element(By.CLASS_NAME, 'zp_Y6y8d')
-            job_title = job_title_element.text if job_title_element else ''
-
-            company_name = ''
-            for link in tbody.find_elements(By.TAG_NAME, 'a'):
-                if 'accounts' in link.get_attribute('href'):
-                    company_name = link.text
-                    break
-
-            phone_number = tbody.find_elements(By.TAG_NAME, 'a')[-1].text
-
-            button_classes = ["zp-button", "zp_zUY3r", "zp_hLUWg", "zp_n9QPr", "zp_B5hnZ", "zp_MCSwB", "zp_IYteB"]
-            
-            try:
-                button = tbody.find_element(By.CSS_SELECTOR, "." + ".".join(button_classes))
-                if button:
-                    button.click()
-                    email_addresses = find_email_address(driver.page_source)
-                    filtered_emails = filter_emails(email_addresses, 'sentry.io')
-                    with open(csv_file_name, 'a', newline='', encoding='utf-8') as file:
-                        writer = csv.writer(file)
-                        print(f"{first_name} has been poached!")
-                        if len(filtered_emails) == 1:
-                            writer.writerow([first_name, last_name, job_title, company_name, filtered_emails[0], '', linkedin_url, phone_number])
-                        elif len(filtered_emails) == 2:
-                            writer.writerow([first_name, last_name, job_title, company_name, filtered_emails[0], filtered_emails[1], linkedin_url, phone_number])
-                    button.click()
-                    tbody_height = driver.execute_script("return arguments[0].offsetHeight;", tbody)
-                    driver.execute_script("arguments[0].scrollBy(0, arguments[1]);", loaded_section, tbody_height)
-            except NoSuchElementException:
-                continue
-
-        # Pagination Logic
-        next_button_selector = ".zp-button.zp_zUY3r.zp_MCSwB.zp_xCVC8[aria-label='right-arrow']"
+def csv_field(value):
+    # Quote the way csv.writer does, but only for the rare value that needs it
+    if ',' in value or '"' in value or '\n' in value or '\r' in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+def write_lead(file, first_name, last_name, job_title, company_name, emails, linkedin_url, phone_number):
+    # Fixed 8-column row written directly; csv.writer's per-row machinery isn't needed for this schema
+    if len(emails) in (1, 2):
+        second_email = emails[1] if len(emails) == 2 else ''
+        fields = (first_name, last_name, job_title, company_name, emails[0], second_email, linkedin_url, phone_number)
+        file.write(','.join(csv_field(field) for field in fields) + '\r\n')
+        return True
+    return False
+
+def load_seen_linkedin(*csv_paths):
+    # LinkedIn URLs (column 7) already written by an earlier run, so those leads aren't revealed twice
+    seen = set()
+    for csv_path in csv_paths:
+        if os.path.exists(csv_path):
+            with open(csv_path, newline='', encoding='utf-8') as file:
+                seen.update(row[6] for row in csv.reader(file) if len(row) > 6 and row[6])
+    return seen
+
+def build_shard_urls():
+    # One search per employee range x industry tag, so each window pages through its own slice of leads
+    return [
+        f"https://app.apollo.io/#/people?page=1&{SEARCH_FILTERS}"
+        f"&organizationNumEmployeesRanges[]={employees}&organizationIndustryTagIds[]={industry}"
+        for employees in EMPLOYEE_RANGES
+        for industry in INDUSTRY_TAG_IDS
+    ]
+
+def prepare_profile(shard_index):
+    # Chrome locks a user-data-dir, so every shard runs on its own copy of the logged-in profile
+    profile_dir = f"{user_data_dir}_shard{shard_index}"
+    if not os.path.exists(profile_dir):
+        shutil.copytree(user_data_dir, profile_dir)
+    return profile_dir
+
+def create_context(playwright, profile_dir):
+    # Persistent context = the Chrome profile on disk, so the Apollo login carries over
+    context = playwright.chromium.launch_persistent_context(
+        profile_dir, channel='chrome', headless=HEADLESS, args=CHROME_ARGS)
+    context.set_default_timeout(ACTION_TIMEOUT)
+    return context
+
+def block_telemetry(context, page):
+    # Chrome drops these requests itself (CDP), so no per-request Python routing is involved
+    cdp = context.new_cdp_session(page)
+    cdp.send('Network.enable')
+    cdp.send('Network.setBlockedURLs', {'urls': BLOCKED_URLS})
+
+def scrape_shard(url, shard_csv, profile_dir):
+    with sync_playwright() as playwright:
+        context = create_context(playwright, profile_dir)
         try:
-            next_button = driver.find_element(By.CSS_SELECTOR, next_button_selector)
-            next_button.click()
-            time.sleep(1)
-        except NoSuchElementException:
-            print("No more pages to navigate.")
-            break
-
-    except Exception as e:
-        error_message = str(e)
-        if "element click intercepted" in error_message:
-            print("Your leads are ready!")
-            break
-        else:
-            print(f"An error occurred: {error_message}")
-            break
-
-driver.quit()
\ No newline at end of file
+            page = context.pages[0] if context.pages else context.new_page()
+            block_telemetry(context, page)
+            page.goto(url)
+
+            # Wait (up to 200s, long enough to log in on a fresh profile) for the people table instead of always sleeping
+            page.wait_for_selector(LOADED_SECTION_SELECTOR, timeout=200000)
+
+            # One handle for the whole run; rows are block-buffered and forced to disk every FLUSH_EVERY rows
+            with open(shard_csv, 'a', newline='', encoding='utf-8', buffering=1 << 16) as file:
+                seen = load_seen_linkedin(csv_file_name, shard_csv)
+                failures = 0
+                rows_since_flush = 0
+                while True:
+                    try:
+                        # Snapshot every row's fields in a single evaluate, then work from plain Python data;
+                        # a row is only located again (by index) when its reveal button has to be clicked
+                        rows = page.locator(LOADED_SECTION_SELECTOR).first.evaluate(EXTRACT_ROWS_JS, REVEAL_BTN_SELECTOR)
+                        if not rows:
+                            break
+                        tbodies = page.locator(ROW_SELECTOR)
+
+                        for row in rows:
+                            first_name, last_name = split_name(row['name'])
+                            linkedin_url = row['linkedin']
+                            job_title = row['title']
+                            company_name = row['company']
+                            phone_number = row['phone']
+
+                            # Skip leads already written (earlier run, page overlap, retried page) before any click
+                            if linkedin_url and linkedin_url in seen:
+                                continue
+
+                            if row['email_inline']:
+                                filtered_emails = row['email_inline']
+                            else:
+                                if not row['has_button']:
+                                    continue
+
+                                tbody = tbodies.nth(row['idx'])
+                                button = tbody.locator(REVEAL_BTN_SELECTOR).first
+                                if button.count() == 0:
+                                    continue
+                                button.click()
+                                # The revealed emails show in the popover this button opens (linked by id); waiting for it
+                                # is also the sync point for the click. Fall back to the row's own text if there is no such
+                                # popover or it holds no email (Apollo rendered them inline instead)
+                                email_addresses = []
+                                popover_id = button.evaluate(POPOVER_ID_JS)
+                                if popover_id:
+                                    popover = page.locator(f"{POPOVER_SELECTOR}[id='{popover_id}']")
+                                    try:
+                                        popover.wait_for(timeout=2000)
+                                        email_addresses = find_email_address(popover.inner_text())
+                                    except PlaywrightTimeoutError:
+                                        pass
+                                if not email_addresses:
+                                    email_addresses = find_email_address(tbody.inner_text())
+                                button.click()
+                                filtered_emails = filter_emails(email_addresses, 'sentry.io')
+
+                            print(f"{first_name} has been poached!")
+                            if write_lead(file, first_name, last_name, job_title, company_name, filtered_emails, linkedin_url, phone_number):
+                                if linkedin_url:
+                                    seen.add(linkedin_url)
+                                rows_since_flush += 1
+                                if rows_since_flush >= FLUSH_EVERY:
+                                    file.flush()
+                                    os.fsync(file.fileno())
+                                    rows_since_flush = 0
+
+                        # One scroll per page (instead of one per row) keeps any lazily rendered rows coming
+                        tbodies.last.evaluate("tb => tb.scrollIntoView({block: 'end'})")
+
+                        # Pagination Logic
+                        next_button = page.locator(NEXT_BUTTON_SELECTOR).first
+                        if next_button.count() == 0:
+                            print("No more pages to navigate.")
+                            break
+                        first_row = tbodies.first.element_handle()
+                        next_button.click()
+                        # The next page has rendered once the old rows are detached and the table reports loaded again
+                        try:
+                            page.wait_for_function("tb => !tb.isConnected", arg=first_row)
+                        except PlaywrightTimeoutError:
+                            pass  # Rows re-rendered in place
+                        finally:
+                            first_row.dispose()
+                        page.wait_for_selector(LOADED_SECTION_SELECTOR)
+                        failures = 0
+
+                    except PlaywrightError as e:
+                        # Apollo's upgrade popup covering the table is how a finished (credit-capped) run ends
+                        if isinstance(e, PlaywrightTimeoutError) and "intercepts pointer events" in e.message:
+                            print("Your leads are ready!")
+                            break
+                        # Anything else (row re-rendered mid-click, slow page) is retried on the current page
+                        failures += 1
+                        if failures > MAX_PAGE_RETRIES:
+                            print(f"An error occurred: {e.message}")
+                            break
+                        time.sleep(2 ** failures)
+        finally:
+            context.close()
+
+def merge_shard_csvs(shard_csvs, csv_path):
+    # Append every shard's rows to the main CSV, then drop the shard files
+    with open(csv_path, 'a', newline='', encoding='utf-8') as out:
+        for shard_csv in shard_csvs:
+            if os.path.exists(shard_csv):
+                with open(shard_csv, newline='', encoding='utf-8') as shard:
+                    shutil.copyfileobj(shard, out)
+                os.remove(shard_csv)
+
+if __name__ == '__main__':
+    shard_urls = build_shard_urls()
+    stem, ext = os.path.splitext(csv_file_name)
+    shard_csvs = [f"{stem}_shard{i}{ext}" for i in range(len(shard_urls))]
+    profile_dirs = [prepare_profile(i) for i in range(len(shard_urls))]
+
+    try:
+        with ProcessPoolExecutor(max_workers=min(MAX_WORKERS, len(shard_urls))) as executor:
+            list(executor.map(scrape_shard, shard_urls, shard_csvs, profile_dirs))
+    finally:
+        # Keep whatever the shards managed to write, even if one of them crashed
+        merge_shard_csvs(shard_csvs, csv_file_name)